@@ -68,12 +68,16 @@ class ItemData:
         status: Current status (Open, In Progress, Done, etc.)
         updates: List of updates (comments, status changes, etc.)
         raw_data: Full raw response from the API for adapter-specific processing
+        not_modified: True if the item hasn't changed since the `since` passed
+            to fetch_item_data, so raw_data may be partial and the README
+            needs no update
     """
 
     title: str
     status: str
     updates: List[Dict[str, Any]] = field(default_factory=list)
     raw_data: Dict[str, Any] = field(default_factory=dict)
+    not_modified: bool = False
 
 
 class Adapter(ABC):
@@ -15,9 +15,10 @@ import logging
 import os
 import re
 import subprocess
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlencode
 
 import yaml
 
@@ -72,6 +73,65 @@ def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
     return frontmatter, body
 
 
+# Leading characters that make a YAML value more than a plain one-line scalar
+_NON_PLAIN_SCALAR_CHARS = frozenset("'\"&*!|>%@`[{#")
+
+
+def _resolves_to_non_string(value: str) -> bool:
+    """Check whether a plain YAML scalar resolves to a non-string type."""
+    resolvers = yaml.SafeLoader.yaml_implicit_resolvers.get(value[0], [])
+    return any(regexp.match(value) for _, regexp in resolvers)
+
+
+def read_frontmatter_fields(content: str, keys: List[str]) -> Dict[str, Any]:
+    """Read a few top-level scalar fields from YAML frontmatter.
+
+    Scans frontmatter lines for ``key: value`` pairs and stops as soon as
+    every requested key has been seen, so large trailing fields (like
+    synced comments) are never parsed. Falls back to a full YAML parse of
+    the frontmatter if a requested value is quoted, a block scalar, or
+    otherwise not a plain one-line string. Plain values YAML would read as
+    something other than a string (null, ~, numbers, booleans, dates) are
+    resolved the same way yaml.safe_load would.
+
+    Args:
+        content: Markdown content with optional YAML frontmatter
+        keys: Top-level frontmatter keys to read
+
+    Returns:
+        Dict with the requested keys that were found
+    """
+    if not content.startswith("---"):
+        return {}
+
+    wanted = set(keys)
+    fields: Dict[str, Any] = {}
+
+    for line in content.split("\n")[1:]:
+        if line.rstrip() == "---":
+            break
+        if not line or line[0].isspace():
+            continue
+
+        key, sep, value = line.partition(":")
+        if not sep or key not in wanted:
+            continue
+
+        value = value.strip()
+        if not value or value[0] in _NON_PLAIN_SCALAR_CHARS or " #" in value:
+            frontmatter, _ = parse_frontmatter(content)
+            return {k: frontmatter[k] for k in keys if k in frontmatter}
+
+        if _resolves_to_non_string(value):
+            fields[key] = yaml.safe_load(value)
+        else:
+            fields[key] = value
+        if len(fields) == len(wanted):
+            break
+
+    return fields
+
+
 def build_frontmatter(data: Dict[str, Any]) -> str:
     """Build YAML frontmatter string.
 
@@ -100,6 +160,39 @@ try:
 except ImportError:
     PANDOC_AVAILABLE = False
 
+# Adaptive polling: each sync that finds an issue unchanged doubles the
+# wait before it is fetched again, up to the max. Any change resets it.
+_POLL_BASE_INTERVAL = timedelta(minutes=5)
+_POLL_MAX_INTERVAL = timedelta(hours=1)
+
+# The issue fields that READMEs, metadata and change detection read. Left
+# unfiltered, Jira returns every field, custom fields and description
+# included, which is most of each response.
+_ISSUE_FIELDS = "summary,status,assignee,updated"
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON, using orjson when it is installed.
+
+    orjson's JSONDecodeError subclasses the stdlib one, so callers catch
+    json.JSONDecodeError either way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to two-space indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 class JiraAdapter(Adapter):
     """Adapter for syncing Jira issues via jirahhh CLI."""
@@ -163,7 +256,7 @@ class JiraAdapter(Adapter):
             return []
 
         try:
-            search_data = json.loads(result.stdout)
+            search_data = _json_loads(result.stdout)
         except json.JSONDecodeError:
             return []
 
@@ -191,7 +284,10 @@ class JiraAdapter(Adapter):
 
         Args:
             item: The Jira item to fetch
-            since: Optional timestamp (not used for Jira currently)
+            since: Jira "updated" timestamp from the last sync. If the issue
+                still carries it, nothing has changed (new comments bump it
+                too), so the comments call is skipped and the result is
+                marked not_modified.
 
         Returns:
             ItemData with title, status, and raw Jira data including comments
@@ -201,7 +297,8 @@ class JiraAdapter(Adapter):
 
         # Call jirahhh API to get full issue data
         jirahhh_command = self._get_command("jirahhh")
-        cmd = [jirahhh_command, "api", "GET", f"/rest/api/2/issue/{issue_key}", "--env", jira_env]
+        issue_path = f"/rest/api/2/issue/{issue_key}?fields={_ISSUE_FIELDS}"
+        cmd = [jirahhh_command, "api", "GET", issue_path, "--env", jira_env]
 
         logger.debug("Executing: %s", " ".join(cmd))
         # Propagate current log level to jirahhh subprocess
@@ -224,24 +321,14 @@ class JiraAdapter(Adapter):
 
         # Parse JSON response
         try:
-            jira_data = json.loads(result.stdout)
+            jira_data = _json_loads(result.stdout)
         except json.JSONDecodeError:
             return ItemData(title="", status="", raw_data={})
 
-        # Extract fields
-        title = ""
-        status = ""
+        title, status = self._title_and_status(jira_data)
 
-        if "fields" in jira_data:
-            # JSON format from Jira API
-            fields = jira_data["fields"]
-            title = fields.get("summary", "")
-            status_obj = fields.get("status", {})
-            status = status_obj.get("name", "") if isinstance(status_obj, dict) else str(status_obj)
-        else:
-            # Fallback
-            title = jira_data.get("summary", "")
-            status = jira_data.get("status", "")
+        if since is not None and (jira_data.get("fields") or {}).get("updated") == since:
+            return ItemData(title=title, status=status, raw_data=jira_data, not_modified=True)
 
         # Fetch comments
         comments_cmd = [jirahhh_command, "api", "GET", f"/rest/api/2/issue/{issue_key}/comment", "--env", jira_env]
@@ -259,7 +346,7 @@ class JiraAdapter(Adapter):
         comments_data = {}
         if comments_result and comments_result.returncode == 0:
             try:
-                comments_data = json.loads(comments_result.stdout)
+                comments_data = _json_loads(comments_result.stdout)
             except json.JSONDecodeError:
                 pass
 
@@ -272,6 +359,99 @@ class JiraAdapter(Adapter):
             raw_data=jira_data,
         )
 
+    def fetch_items_bulk(
+        self, items: List[TrackedItem], since: Optional[Dict[str, str]] = None
+    ) -> Dict[str, ItemData]:
+        """Fetch several Jira issues with one JQL search per environment.
+
+        Requests `issue in (...)` with the README's fields plus comments, so
+        each issue's comments come embedded instead of needing a second call
+        per issue. Issues missing from the response, or whose embedded
+        comments were truncated, are left out so the caller can fall back to
+        fetch_item_data.
+
+        Args:
+            items: The Jira items to fetch
+            since: Jira "updated" timestamps from the last sync, by issue key.
+                Issues still carrying theirs are marked not_modified, as in
+                fetch_item_data.
+
+        Returns:
+            Dict mapping issue key -> ItemData for the issues fetched
+        """
+        keys_by_env: Dict[str, List[str]] = {}
+        for item in items:
+            issue_key = item.metadata.get("issue") or item.id
+            keys_by_env.setdefault(item.metadata.get("env", "prod"), []).append(issue_key)
+
+        jirahhh_command = self._get_command("jirahhh")
+        subprocess_env = os.environ.copy()
+        subprocess_env["JIRAHHH_LOG_LEVEL"] = logging.getLevelName(logger.getEffectiveLevel())
+
+        fetched: Dict[str, ItemData] = {}
+        for jira_env, keys in keys_by_env.items():
+            query = urlencode({
+                "jql": f"issue in ({', '.join(keys)})",
+                "fields": f"{_ISSUE_FIELDS},comment",
+                "maxResults": len(keys),
+            })
+            cmd = [jirahhh_command, "api", "GET", f"/rest/api/2/search?{query}", "--env", jira_env]
+
+            logger.debug("Executing: %s", " ".join(cmd))
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=None,  # Inherit stderr - shows jirahhh logs in real-time
+                text=True,
+                env=subprocess_env,
+            )
+            logger.debug("Command completed with return code %d", result.returncode)
+
+            if result.returncode != 0:
+                continue
+
+            try:
+                search_data = _json_loads(result.stdout)
+            except json.JSONDecodeError:
+                continue
+
+            for jira_data in search_data.get("issues", []):
+                issue_key = jira_data.get("key")
+                comments_data = (jira_data.get("fields") or {}).get("comment") or {}
+                if not issue_key or comments_data.get("total", 0) > len(
+                    comments_data.get("comments", [])
+                ):
+                    continue
+
+                # Same shape as the /comment response fetch_item_data stores
+                jira_data["comments"] = comments_data
+                title, status = self._title_and_status(jira_data)
+                last_updated = (since or {}).get(issue_key)
+                fetched[issue_key] = ItemData(
+                    title=title,
+                    status=status,
+                    raw_data=jira_data,
+                    not_modified=last_updated is not None
+                    and jira_data["fields"].get("updated") == last_updated,
+                )
+
+        return fetched
+
+    def _title_and_status(self, jira_data: Dict[str, Any]) -> Tuple[str, str]:
+        """Extract the title and status name from a Jira issue response."""
+        if "fields" in jira_data:
+            # JSON format from Jira API
+            fields = jira_data["fields"]
+            title = fields.get("summary", "")
+            status_obj = fields.get("status", {})
+            status = status_obj.get("name", "") if isinstance(status_obj, dict) else str(status_obj)
+        else:
+            # Fallback
+            title = jira_data.get("summary", "")
+            status = jira_data.get("status", "")
+
+        return title, status
+
     def get_storage_path(self, item: TrackedItem, title: Optional[str] = None) -> Path:
         """Get README.md path for this Jira issue.
 
@@ -494,8 +674,7 @@ class JiraAdapter(Adapter):
             return {}
 
         try:
-            with open(metadata_path, "r") as f:
-                return json.load(f)
+            return _json_loads(metadata_path.read_bytes())
         except (json.JSONDecodeError, IOError):
             return {}
 
@@ -507,6 +686,7 @@ class JiraAdapter(Adapter):
             data: ItemData containing current state
         """
         metadata_path = self._get_metadata_path(readme_path)
+        prev_metadata = self.load_metadata(readme_path)
 
         metadata = {
             "last_sync": datetime.utcnow().isoformat(),
@@ -517,12 +697,43 @@ class JiraAdapter(Adapter):
             fields = data.raw_data["fields"]
             metadata["updated"] = fields.get("updated")
 
+        # Count syncs in a row that found the issue unchanged, for is_poll_due
+        prev_updated = prev_metadata.get("updated")
+        if prev_updated is not None and prev_updated == metadata.get("updated"):
+            metadata["quiet_syncs"] = prev_metadata.get("quiet_syncs", 0) + 1
+        else:
+            metadata["quiet_syncs"] = 0
+
         try:
-            with open(metadata_path, "w") as f:
-                json.dump(metadata, f, indent=2)
+            metadata_path.write_bytes(_json_dumps(metadata))
         except IOError:
             pass
 
+    def is_poll_due(self, readme_path: Path, now: Optional[datetime] = None) -> bool:
+        """Check whether an issue should be fetched again yet.
+
+        The wait after the last sync starts at _POLL_BASE_INTERVAL and doubles
+        for every sync in a row that found the issue unchanged, capped at
+        _POLL_MAX_INTERVAL.
+
+        Args:
+            readme_path: Path to the README file
+            now: Current UTC time (defaults to datetime.utcnow())
+
+        Returns:
+            True if the issue is due, or has no usable metadata yet
+        """
+        metadata = self.load_metadata(readme_path)
+        try:
+            last_sync = datetime.fromisoformat(metadata["last_sync"])
+            quiet_syncs = int(metadata.get("quiet_syncs", 0))
+        except (KeyError, TypeError, ValueError):
+            return True
+
+        # 2**5 already exceeds the cap; don't build huge intervals
+        interval = min(_POLL_MAX_INTERVAL, _POLL_BASE_INTERVAL * 2 ** min(quiet_syncs, 5))
+        return (now or datetime.utcnow()) >= last_sync + interval
+
     def detect_changes(self, readme_path: Path, data: ItemData) -> bool:
         """Detect if issue has been updated since last sync.
 
@@ -569,7 +780,7 @@ class JiraAdapter(Adapter):
             return f"### [{issue_key}]\n**Status:** Unknown\n"
 
         content = readme_path.read_text()
-        frontmatter, _ = parse_frontmatter(content)
+        frontmatter = read_frontmatter_fields(content, ["title", "status"])
 
         title = frontmatter.get("title", "")
         status = frontmatter.get("status", "Unknown")
@@ -601,17 +812,21 @@ class JiraAdapter(Adapter):
         Returns:
             Path to README.md or None if not found
         """
-        issue_key = item.id
-        jira_dir = self.base_path / "tracking" / "areas" / "jira"
+        prefix = f"{item.id}-"
+        # Scan with plain string paths; this runs once per tracked item
+        jira_dir = os.path.join(self.base_path, "tracking", "areas", "jira")
 
-        if not jira_dir.exists():
+        try:
+            entries = os.scandir(jira_dir)
+        except FileNotFoundError:
             return None
 
-        for item_dir in jira_dir.iterdir():
-            if item_dir.is_dir() and item_dir.name.startswith(f"{issue_key}-"):
-                readme = item_dir / "README.md"
-                if readme.exists():
-                    return readme
+        with entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.is_dir():
+                    readme = os.path.join(entry.path, "README.md")
+                    if os.path.exists(readme):
+                        return Path(readme)
 
         return None
 
@@ -5,13 +5,129 @@ The agenda system provides a living AGENDA.md file that combines:
 - Command-driven sections: Auto-populated by running shell commands
 - Logbook: Automatic archival of completed tasks to LOGBOOK.md files
 """
+import functools
+import hashlib
+import json
+import os
 import re
+import shlex
+import shutil
 import subprocess
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from cli.cache import cache_dir, cache_file_for, load_memoized
+
+# Patterns used when parsing AGENDA.md, README.md and LOGBOOK.md content.
+# Compiled once at import so the parsing helpers never go through re's cache.
+_AGENDA_HEADER_RE = re.compile(r"^# Agenda - .*$", re.MULTILINE)
+_FOCUS_DATE_RE = re.compile(r"^\*\*📅\s+\d{4}-\d{2}-\d{2}\s+\w+\*\*$", re.MULTILINE)
+_H2_RE = re.compile(r"^## ", re.MULTILINE)
+_SECTION_RE = re.compile(r"(## [^\n]+)\n(.*?)(?=\n## |\Z)", re.DOTALL)
+_NEXT_SECTION_RE = re.compile(r"\n##\s")
+_TRACKED_ITEM_HEADING_RE = re.compile(r"###\s+\[([A-Z]+-\d+)\]")
+_README_TITLE_RE = re.compile(r"^#\s+[A-Z]+-\d+:\s+(.+)$", re.MULTILINE)
+_README_STATUS_RE = re.compile(r"\*\*Status\*\*:\s+(.+)$", re.MULTILINE)
+_README_ASSIGNEE_RE = re.compile(r"\*\*Assignee\*\*:\s+(.+)$", re.MULTILINE)
+_ISSUE_KEY_RE = re.compile(r"\[([A-Z]+-\d+)\]")
+_COMPLETION_DATE_RE = re.compile(r"✅ (\d{4}-\d{2}-\d{2})")
+_COMPLETED_TASK_RE = re.compile(r"- \[x\].*?✅ (\d{4}-\d{2}-\d{2})")
+# Characters that make a section command depend on /bin/sh: operators,
+# redirects, expansions, globs, comments and variable assignments
+_SHELL_SYNTAX_RE = re.compile(r"[|&;<>()$`\\*?\[\]{}~#=!\n]")
+
+# Tracked item subsection headings and the key each is collected under
+_SUBSECTION_HEADINGS = {"#### Actions": "actions", "#### Notes": "notes"}
+
+# Emoji shown next to a tracked item's Jira status (unknown statuses get ⚪)
+_STATUS_EMOJI = {
+    "In Progress": "🟢",
+    "Refinement": "❓",
+    "To Do": "⚪",
+    "Done": "✅",
+    "Blocked": "🔴",
+}
+
+# Cache directory for the parsed LOGBOOK.md, so appends can skip re-parsing
+_LOGBOOK_CACHE_DIR = "logbook"
+
+
+def _safe_loader() -> type:
+    """Return PyYAML's safe loader class, importing PyYAML on first use.
+
+    PyYAML is only needed by the commands that read gameplan.yaml, so it is
+    not imported when cli.agenda is loaded. Prefers the libyaml-backed
+    CSafeLoader when available.
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _load_agenda_config(base_path: Path, require_agenda: bool = False) -> Dict[str, Any]:
+    """Load gameplan.yaml for the agenda commands.
+
+    Uses the libyaml-backed loader when available. The document is composed
+    once and the top-level keys are checked before any Python objects are
+    constructed, so a config without an 'agenda' section is rejected without
+    building the rest of the tree. The parsed config is memoized until the
+    file's mtime or size changes; callers must treat it as read-only.
+
+    Args:
+        base_path: Base directory containing gameplan.yaml
+        require_agenda: Raise ValueError if the 'agenda' section is missing
 
-import yaml
+    Returns:
+        Configuration dictionary
+
+    Raises:
+        FileNotFoundError: If gameplan.yaml not found
+        ValueError: If require_agenda is set and config has no 'agenda' section
+    """
+    config_file = base_path / "gameplan.yaml"
+    try:
+        config = load_memoized(
+            config_file, lambda raw: _parse_agenda_config(raw, require_agenda)
+        )
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"gameplan.yaml not found at {base_path}. "
+            "Run 'gameplan init' first."
+        ) from None
+
+    # A memoized config may have been parsed without the agenda check
+    if require_agenda and not (isinstance(config, dict) and "agenda" in config):
+        raise ValueError(
+            "No 'agenda' section in gameplan.yaml. "
+            "Add an 'agenda' section with 'sections' list."
+        )
+    return config
+
+
+def _parse_agenda_config(raw: bytes, require_agenda: bool) -> Any:
+    """Parse gameplan.yaml bytes, checking top-level keys before construction."""
+    import yaml
+
+    loader = _safe_loader()(raw)
+    try:
+        root = loader.get_single_node()
+
+        if require_agenda:
+            top_keys = set()
+            if isinstance(root, yaml.MappingNode):
+                top_keys = {key.value for key, _ in root.value}
+            if "agenda" not in top_keys:
+                raise ValueError(
+                    "No 'agenda' section in gameplan.yaml. "
+                    "Add an 'agenda' section with 'sections' list."
+                )
+
+        return {} if root is None else loader.construct_document(root) or {}
+    finally:
+        loader.dispose()
 
 
 def init_agenda(base_path: Optional[Path] = None) -> Path:
@@ -32,35 +148,22 @@ def init_agenda(base_path: Optional[Path] = None) -> Path:
         base_path = Path.cwd()
 
     # Load config
-    config_file = base_path / "gameplan.yaml"
-    if not config_file.exists():
-        raise FileNotFoundError(
-            f"gameplan.yaml not found at {base_path}. "
-            "Run 'gameplan init' first."
-        )
+    config = _load_agenda_config(base_path, require_agenda=True)
 
-    with open(config_file) as f:
-        config = yaml.safe_load(f)
-
-    if "agenda" not in config:
-        raise ValueError(
-            "No 'agenda' section in gameplan.yaml. "
-            "Add an 'agenda' section with 'sections' list."
-        )
+    # Generate AGENDA.md content
+    content = _generate_agenda_content(config["agenda"])
 
-    # Check if AGENDA.md already exists
+    # Write AGENDA.md in one call; exclusive-create mode ('x') doubles as the
+    # existence check, so an existing agenda is never overwritten
     agenda_file = base_path / "AGENDA.md"
-    if agenda_file.exists():
+    try:
+        with open(agenda_file, "xb") as f:
+            f.write(content.encode("utf-8"))
+    except FileExistsError:
         raise FileExistsError(
             f"AGENDA.md already exists at {base_path}. "
             "Use 'gameplan agenda refresh' to update it."
-        )
-
-    # Generate AGENDA.md content
-    content = _generate_agenda_content(config["agenda"])
-
-    # Write AGENDA.md
-    agenda_file.write_text(content)
+        ) from None
 
     return agenda_file
 
@@ -122,15 +225,7 @@ def refresh_agenda(
     skip_lower = [s.lower() for s in skip_sections]
 
     # Load config
-    config_file = base_path / "gameplan.yaml"
-    if not config_file.exists():
-        raise FileNotFoundError(
-            f"gameplan.yaml not found at {base_path}. "
-            "Run 'gameplan init' first."
-        )
-
-    with open(config_file) as f:
-        config = yaml.safe_load(f)
+    config = _load_agenda_config(base_path)
 
     # Load current AGENDA.md
     agenda_file = base_path / "AGENDA.md"
@@ -140,12 +235,11 @@ def refresh_agenda(
             "Run 'gameplan agenda init' first."
         )
 
+    content = agenda_file.read_text()
+
     # Process logbook FIRST (before other updates)
     # This extracts completed tasks, logs them, and removes from agenda
-    process_logbook(base_path)
-
-    # Re-read content after logbook processing
-    content = agenda_file.read_text()
+    content, _, _ = _process_logbook_content(content, base_path)
 
     # Update date header to today
     content = _update_date_header(content)
@@ -156,15 +250,25 @@ def refresh_agenda(
     # Reorder sections to match config order (preserving content)
     content = _reorder_sections(content, sections)
 
-    # Update command-driven sections (skip any in the skip list)
-    for section in sections:
-        if "command" in section:
-            if section["name"].lower() in skip_lower:
-                continue
-            content = _update_command_section(content, section, base_path)
-
-    # Write updated content
-    agenda_file.write_text(content)
+    # Update command-driven sections (skip any in the skip list). The
+    # commands are independent and mostly wait on I/O, so run them
+    # concurrently and splice the results back in config order.
+    to_run = [
+        s for s in sections
+        if "command" in s and s["name"].lower() not in skip_lower
+    ]
+    if to_run:
+        with ThreadPoolExecutor(max_workers=min(8, len(to_run))) as executor:
+            outputs = list(executor.map(
+                lambda section: _run_section_command(section, base_path),
+                to_run,
+            ))
+        for section, output in zip(to_run, outputs, strict=True):
+            content = _replace_section_content(content, section, output)
+
+    # Write updated content atomically so an interrupted refresh can't
+    # leave a truncated agenda
+    _atomic_write_text(agenda_file, content)
 
     return agenda_file
 
@@ -179,7 +283,7 @@ def _generate_agenda_content(agenda_config: Dict[str, Any]) -> str:
         Formatted AGENDA.md content
     """
     # Start with date header
-    today = datetime.now().strftime("%A, %B %d, %Y")
+    today, _, _ = _today_strings(date.today())
     lines = [f"# Agenda - {today}", ""]
 
     # Add each section
@@ -191,6 +295,20 @@ def _generate_agenda_content(agenda_config: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=1)
+def _today_strings(day: date) -> Tuple[str, str, str]:
+    """Format a date for the agenda headers, caching the current day.
+
+    Args:
+        day: Date to format (normally date.today())
+
+    Returns:
+        Tuple of (long_form, iso_form, weekday), e.g.
+        ('Monday, January 05, 2026', '2026-01-05', 'Monday')
+    """
+    return (day.strftime("%A, %B %d, %Y"), day.isoformat(), day.strftime("%A"))
+
+
 def _update_date_header(content: str) -> str:
     """Update the date header in AGENDA.md to today's date.
 
@@ -204,18 +322,13 @@ def _update_date_header(content: str) -> str:
     Returns:
         Updated content with today's date
     """
-    now = datetime.now()
-    today_long = now.strftime("%A, %B %d, %Y")
-    today_iso = now.strftime("%Y-%m-%d")
-    today_day = now.strftime("%A")
+    today_long, today_iso, today_day = _today_strings(date.today())
 
     # Format 1: # Agenda - [any date]
-    pattern1 = r"^# Agenda - .*$"
-    content = re.sub(pattern1, f"# Agenda - {today_long}", content, count=1, flags=re.MULTILINE)
+    content = _AGENDA_HEADER_RE.sub(f"# Agenda - {today_long}", content, count=1)
 
     # Format 2: **📅 YYYY-MM-DD DayOfWeek** (bold date line in Focus & Priorities)
-    pattern2 = r"^\*\*📅\s+\d{4}-\d{2}-\d{2}\s+\w+\*\*$"
-    content = re.sub(pattern2, f"**📅 {today_iso} {today_day}**", content, count=1, flags=re.MULTILINE)
+    content = _FOCUS_DATE_RE.sub(f"**📅 {today_iso} {today_day}**", content, count=1)
 
     return content
 
@@ -235,7 +348,7 @@ def _reorder_sections(content: str, sections: List[Dict[str, Any]]) -> str:
         Updated content with sections in config order
     """
     # Extract header (everything before first ## section)
-    first_section_match = re.search(r"^## ", content, re.MULTILINE)
+    first_section_match = _H2_RE.search(content)
     if not first_section_match:
         # No sections found, just return content as-is
         return content
@@ -244,10 +357,9 @@ def _reorder_sections(content: str, sections: List[Dict[str, Any]]) -> str:
 
     # Extract all existing sections with their content
     # Pattern: ## header\n(content until next ## or end)
-    section_pattern = r"(## [^\n]+)\n(.*?)(?=\n## |\Z)"
     existing_sections = {}
 
-    for match in re.finditer(section_pattern, content, re.DOTALL):
+    for match in _SECTION_RE.finditer(content):
         section_header = match.group(1)
         section_content = match.group(2).rstrip()
         existing_sections[section_header] = section_content
@@ -314,71 +426,194 @@ def _generate_section(section: Dict[str, Any]) -> List[str]:
     return lines
 
 
-def _update_command_section(content: str, section: Dict[str, Any], base_path: Path) -> str:
-    """Update a command-driven section with command output.
+def _run_section_command(section: Dict[str, Any], base_path: Path) -> str:
+    """Run a section's command and return the text to place in the section.
+
+    Failures are reported in the returned text rather than raised. If the
+    section sets 'timeout' (seconds), a command still running after that
+    long is abandoned; without it commands run to completion. If the
+    section sets 'cache_ttl' (seconds), successful output is cached on disk
+    and reused by refreshes within that window.
 
     Args:
-        content: Current AGENDA.md content
         section: Section configuration with 'command' field
         base_path: Base directory to run command from
 
     Returns:
-        Updated AGENDA.md content
+        Command stdout, or an '[Error running command: ...]' message
     """
-    name = section["name"]
-    emoji = section.get("emoji", "")
     command = section["command"]
+    timeout = float(section["timeout"]) if section.get("timeout") else None
+    ttl = float(section.get("cache_ttl") or 0)
+    if ttl <= 0:
+        return _execute_command(command, base_path, timeout)[0]
+
+    cache_file = _command_cache_dir() / hashlib.sha256(
+        f"{base_path}\0{command}".encode("utf-8")
+    ).hexdigest()
+    try:
+        if time.time() - cache_file.stat().st_mtime < ttl:
+            return cache_file.read_text()
+    except OSError:
+        pass
+
+    output, succeeded = _execute_command(command, base_path, timeout)
+    if succeeded:
+        # The cache is an optimization only, so write failures are ignored
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write_text(cache_file, output)
+        except OSError:
+            pass
+    return output
+
+
+def _command_cache_dir() -> Path:
+    """Return the directory for cached section command output."""
+    return cache_dir("commands")
+
+
+def _execute_command(
+    command: str,
+    base_path: Path,
+    timeout: Optional[float] = None,
+) -> Tuple[str, bool]:
+    """Run a command from the base directory and format its result.
 
-    # Build section header pattern
-    if emoji:
-        header_pattern = re.escape(f"## {emoji} {name}")
-    else:
-        header_pattern = re.escape(f"## {name}")
-
-    # Find the section and replace its content
-    # Pattern: ## Header\n[Run: command] OR ## Header\n(existing content)
-    # Replace with: ## Header\n(command output)
+    Args:
+        command: Command string from a section's 'command' field
+        base_path: Base directory to run command from
+        timeout: Seconds to wait before giving up (default: no limit)
 
+    Returns:
+        Tuple of (output, succeeded) where output is the command's stdout
+        or an '[Error running command: ...]' message
+    """
     # Run the command from the base directory
     try:
-        import os
         env = os.environ.copy()
         env["GAMEPLAN_BASE_DIR"] = str(base_path)
 
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            cwd=str(base_path),
-            env=env,
-        )
+        argv = _simple_command_argv(command)
+        result = None
+        if argv:
+            # Plain commands are exec'd directly, saving a /bin/sh per section
+            try:
+                result = subprocess.run(
+                    argv,
+                    capture_output=True,
+                    text=True,
+                    cwd=str(base_path),
+                    env=env,
+                    timeout=timeout,
+                )
+            except (FileNotFoundError, PermissionError):
+                # Not an executable (e.g. a shell builtin); let the shell decide
+                result = None
+        if result is None:
+            result = subprocess.run(
+                command,
+                shell=True,
+                capture_output=True,
+                text=True,
+                cwd=str(base_path),
+                env=env,
+                timeout=timeout,
+            )
 
         if result.returncode == 0:
-            output = result.stdout.strip()
+            return (result.stdout.strip(), True)
+
+        # Include stderr in error for debugging
+        stderr = result.stderr.strip() if result.stderr else ""
+        if stderr:
+            output = f"[Error running command: Command failed]\n{stderr}"
         else:
-            # Include stderr in error for debugging
-            stderr = result.stderr.strip() if result.stderr else ""
-            if stderr:
-                output = f"[Error running command: Command failed]\n{stderr}"
-            else:
-                output = "[Error running command: Command failed]"
+            output = "[Error running command: Command failed]"
     except subprocess.TimeoutExpired:
         output = "[Error running command: Timeout]"
     except Exception as e:
         output = f"[Error running command: {str(e)}]"
 
-    # Find section and replace content between this header and next header (or end)
-    # Pattern to match: ## Header\n(anything until next ## or end)
-    # Note: Use '\n## ' (with space) to match only h2 headers, not h3/h4/etc (###, ####)
-    pattern = rf"({header_pattern})\n.*?(?=\n## |\n$|$)"
+    return (output, False)
+
+
+@functools.lru_cache(maxsize=128)
+def _simple_command_argv(command: str) -> Optional[Tuple[str, ...]]:
+    """Split a command into argv if it needs no shell features.
+
+    Cached per command string, since the same section commands are parsed
+    on every refresh.
+
+    Args:
+        command: Command string from a section's 'command' field
+
+    Returns:
+        Argument tuple, or None if the command uses pipes, redirects,
+        expansions or other syntax that requires /bin/sh
+    """
+    if _SHELL_SYNTAX_RE.search(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    return tuple(argv) or None
+
 
-    replacement = rf"\1\n{output}"
+def _replace_section_content(content: str, section: Dict[str, Any], output: str) -> str:
+    """Replace a section's body in AGENDA.md content.
 
-    # Use re.DOTALL to make . match newlines
-    updated = re.sub(pattern, replacement, content, flags=re.DOTALL)
+    Args:
+        content: Current AGENDA.md content
+        section: Section configuration with 'name' and optional 'emoji'
+        output: New body for the section
 
-    return updated
+    Returns:
+        Updated AGENDA.md content
+    """
+    name = section["name"]
+    emoji = section.get("emoji", "")
+
+    # Build section header line
+    if emoji:
+        header = f"## {emoji} {name}\n"
+    else:
+        header = f"## {name}\n"
+
+    # Replace the content between each occurrence of this header (at the
+    # start of a line) and the next h2 header or the end of the file. The
+    # output is spliced in literally, so backslashes in it are preserved.
+    # Note: Search for '\n## ' (with space) to match only h2 headers, not
+    # h3/h4/etc (###, ####)
+    pieces = []
+    pos = 0
+    while True:
+        start = content.find(header, pos)
+        if start == -1:
+            break
+        body_start = start + len(header)
+        if start > 0 and content[start - 1] != "\n":
+            # Header text inside another line (e.g. '### Notes'); keep it
+            pieces.append(content[pos:body_start])
+            pos = body_start
+            continue
+
+        end = content.find("\n## ", body_start - 1)
+        if end == -1:
+            # Keep a single trailing newline at the end of the file
+            end = len(content) - 1 if content.endswith("\n") else len(content)
+            end = max(end, body_start)
+
+        pieces.append(content[pos:body_start])
+        pieces.append(output)
+        pos = end
+
+    if not pieces:
+        return content
+
+    pieces.append(content[pos:])
+    return "".join(pieces)
 
 
 def format_tracked_items(base_path: Optional[Path] = None) -> str:
@@ -398,15 +633,13 @@ def format_tracked_items(base_path: Optional[Path] = None) -> str:
     if base_path is None:
         base_path = Path.cwd()
 
-    config_file = base_path / "gameplan.yaml"
-    if not config_file.exists():
+    try:
+        config = _load_agenda_config(base_path)
+    except FileNotFoundError:
         return "_No gameplan.yaml found_"
 
-    with open(config_file) as f:
-        config = yaml.safe_load(f)
-
     areas = config.get("areas", {})
-    items_md = []
+    to_format = []
 
     # Jira items
     jira_area = areas.get("jira", {})
@@ -415,8 +648,7 @@ def format_tracked_items(base_path: Optional[Path] = None) -> str:
         jira_items = jira_adapter.load_config(jira_area)
 
         for item in jira_items:
-            item_md = jira_adapter.format_agenda_item(item)
-            items_md.append(item_md)
+            to_format.append((jira_adapter, item))
 
     # Misc items
     misc_area = areas.get("misc", {})
@@ -425,67 +657,83 @@ def format_tracked_items(base_path: Optional[Path] = None) -> str:
         misc_items = misc_adapter.load_config(misc_area)
 
         for item in misc_items:
-            item_md = misc_adapter.format_agenda_item(item)
-            items_md.append(item_md)
+            to_format.append((misc_adapter, item))
 
-    if not items_md:
+    if not to_format:
         return "_No tracked items_"
 
+    # Formatting an item is mostly reading its README, so overlap the reads.
+    # executor.map keeps the results in config order.
+    if len(to_format) == 1:
+        adapter, item = to_format[0]
+        items_md = [adapter.format_agenda_item(item)]
+    else:
+        with ThreadPoolExecutor(max_workers=min(16, len(to_format))) as executor:
+            items_md = list(executor.map(
+                lambda pair: pair[0].format_agenda_item(pair[1]),
+                to_format,
+            ))
+
     return "\n".join(items_md)
 
 
 def _extract_tracked_item_subsections(content: str) -> Dict[str, Dict[str, str]]:
     """Extract Actions and Notes subsections for each tracked item from AGENDA.md.
 
+    Scans the lines once, collecting each item's Actions and Notes lines
+    into buffers that are joined when the item ends.
+
     Args:
         content: Current AGENDA.md content
 
     Returns:
         Dict mapping issue keys to their Actions/Notes content
     """
-    result = {}
-
-    # Pattern to match tracked items: ### [ISSUE-KEY] Title
-    item_pattern = r"###\s+\[([A-Z]+-\d+)\][^\n]*\n"
-
-    # Find all tracked items
-    matches = list(re.finditer(item_pattern, content))
-
-    for i, match in enumerate(matches):
-        issue_key = match.group(1)
-
-        # Extract content from this heading to the next ### or ## heading (or end)
-        start = match.end()
-        if i + 1 < len(matches):
-            end = matches[i + 1].start()
-        else:
-            # Look for next ## heading
-            next_section = re.search(r"\n##\s", content[start:])
-            end = start + next_section.start() if next_section else len(content)
+    result: Dict[str, Dict[str, str]] = {}
+    issue_key: Optional[str] = None
+    # Buffers for the current item, keyed 'actions'/'notes'
+    buffers: Dict[str, List[str]] = {}
+    # Which buffer lines go to, or None outside Actions/Notes
+    current: Optional[List[str]] = None
+
+    def flush() -> None:
+        if issue_key is not None:
+            result[issue_key] = {
+                name: "\n".join(buffers.get(name, [])).strip()
+                for name in ("actions", "notes")
+            }
 
-        item_content = content[start:end]
+    for line in content.split('\n'):
+        if line.startswith('#'):
+            # Tracked item heading: ### [ISSUE-KEY] Title
+            item_match = _TRACKED_ITEM_HEADING_RE.match(line)
+            if item_match:
+                flush()
+                issue_key = item_match.group(1)
+                buffers = {}
+                current = None
+                continue
 
-        # Extract Actions subsection
-        actions_match = re.search(
-            r"####\s+Actions\s*\n(.*?)(?=####\s+Notes|###\s+\[|##\s+|$)",
-            item_content,
-            re.DOTALL
-        )
-        actions = actions_match.group(1).strip() if actions_match else ""
+            # Any h2 ends the current item
+            if line.startswith('## '):
+                flush()
+                issue_key = None
+                current = None
+                continue
 
-        # Extract Notes subsection
-        notes_match = re.search(
-            r"####\s+Notes\s*\n(.*?)(?=###\s+\[|##\s+|$)",
-            item_content,
-            re.DOTALL
-        )
-        notes = notes_match.group(1).strip() if notes_match else ""
+            # Actions / Notes subsections (the first of each wins); any
+            # other heading ends the current subsection
+            subsection = _SUBSECTION_HEADINGS.get(line.rstrip())
+            if issue_key is not None and subsection and subsection not in buffers:
+                current = buffers[subsection] = []
+                continue
+            current = None
+            continue
 
-        result[issue_key] = {
-            "actions": actions,
-            "notes": notes
-        }
+        if current is not None:
+            current.append(line)
 
+    flush()
     return result
 
 
@@ -500,32 +748,73 @@ def _read_jira_status(base_path: Path, issue_key: str) -> Dict[str, str]:
         Dict with 'status', 'title', 'assignee' keys
     """
     # Find the tracking directory for this issue
-    jira_dir = base_path / "tracking" / "areas" / "jira"
-    if not jira_dir.exists():
+    jira_dir = os.path.join(base_path, "tracking", "areas", "jira")
+    try:
+        entries = list(os.scandir(jira_dir))
+    except FileNotFoundError:
         return {"status": "Unknown", "title": "", "assignee": ""}
 
     # Find directory matching this issue key
-    for item_dir in jira_dir.iterdir():
-        if item_dir.is_dir() and item_dir.name.startswith(f"{issue_key}-"):
-            readme = item_dir / "README.md"
-            if readme.exists():
-                content = readme.read_text()
+    prefix = f"{issue_key}-"
+    for entry in entries:
+        if entry.name.startswith(prefix) and entry.is_dir():
+            readme = os.path.join(entry.path, "README.md")
+            try:
+                return _scan_readme_status(readme)
+            except FileNotFoundError:
+                continue
 
-                # Extract title from # heading
-                title_match = re.search(r"^#\s+[A-Z]+-\d+:\s+(.+)$", content, re.MULTILINE)
-                title = title_match.group(1) if title_match else ""
+    return {"status": "Unknown", "title": "", "assignee": ""}
 
-                # Extract status
-                status_match = re.search(r"\*\*Status\*\*:\s+(.+)$", content, re.MULTILINE)
-                status = status_match.group(1) if status_match else "Unknown"
 
-                # Extract assignee
-                assignee_match = re.search(r"\*\*Assignee\*\*:\s+(.+)$", content, re.MULTILINE)
-                assignee = assignee_match.group(1) if assignee_match else ""
+def _scan_readme_status(readme: str) -> Dict[str, str]:
+    """Read title, status and assignee from a tracking README in one pass.
 
-                return {"status": status, "title": title, "assignee": assignee}
+    Lines are checked for the cheap literal markers before any regex runs,
+    and reading stops as soon as all three fields are found, so the body
+    of a long README is usually never read.
 
-    return {"status": "Unknown", "title": "", "assignee": ""}
+    Args:
+        readme: Path to README.md
+
+    Returns:
+        Dict with 'status', 'title', 'assignee' keys
+
+    Raises:
+        FileNotFoundError: If the README does not exist
+    """
+    title = status = assignee = None
+
+    with open(readme) as f:
+        for line in f:
+            line = line.rstrip('\n')
+
+            # Extract title from # heading
+            if title is None and line.startswith('#'):
+                title_match = _README_TITLE_RE.match(line)
+                if title_match:
+                    title = title_match.group(1)
+
+            # Extract status
+            if status is None and '**Status**:' in line:
+                status_match = _README_STATUS_RE.search(line)
+                if status_match:
+                    status = status_match.group(1)
+
+            # Extract assignee
+            if assignee is None and '**Assignee**:' in line:
+                assignee_match = _README_ASSIGNEE_RE.search(line)
+                if assignee_match:
+                    assignee = assignee_match.group(1)
+
+            if title is not None and status is not None and assignee is not None:
+                break
+
+    return {
+        "status": status if status is not None else "Unknown",
+        "title": title or "",
+        "assignee": assignee or "",
+    }
 
 
 def _format_single_tracked_item(
@@ -547,13 +836,7 @@ def _format_single_tracked_item(
     title = status_info.get("title", "")
 
     # Map status to emoji
-    status_emoji = {
-        "In Progress": "🟢",
-        "Refinement": "❓",
-        "To Do": "⚪",
-        "Done": "✅",
-        "Blocked": "🔴",
-    }.get(status, "⚪")
+    status_emoji = _STATUS_EMOJI.get(status, "⚪")
 
     lines = []
 
@@ -616,43 +899,56 @@ def extract_completed_tasks(content: str) -> Dict[str, Dict[str, List[str]]]:
             }
         }
     """
-    completed_tasks: Dict[str, Dict[str, List[str]]] = {}
+    return _extract_and_strip(content)[0]
+
+
+def _extract_and_strip(content: str) -> Tuple[Dict[str, Dict[str, List[str]]], str]:
+    """Extract completed tasks and strip them from content in one pass.
+
+    Args:
+        content: AGENDA.md content
+
+    Returns:
+        Tuple of (completed_tasks, content_without_completed_tasks), where
+        completed_tasks has the same shape as extract_completed_tasks()
+    """
+    # Group by (category, date) in one flat dict while scanning; pivot to
+    # the nested shape once at the end
+    flat_tasks: Dict[Tuple[str, str], List[str]] = {}
     current_item_title: Optional[str] = None
     in_actions_section = False
     in_tracked_items_section = False
-
-    # Pattern to match completion date: ✅ YYYY-MM-DD
-    date_pattern = re.compile(r'✅ (\d{4}-\d{2}-\d{2})')
+    kept_lines: List[str] = []
 
     for line in content.split('\n'):
-        # Check for Tracked Items section (## 🔄 Tracked Items or ## Tracked Items)
-        if line.startswith('## ') and 'Tracked Items' in line:
-            in_tracked_items_section = True
-            current_item_title = None
-            in_actions_section = False
-
-        # Check for other h2 sections (end of Tracked Items)
-        elif line.startswith('## ') and 'Tracked Items' not in line:
-            in_tracked_items_section = False
-            current_item_title = None
-            in_actions_section = False
-
-        # Check for item heading (### [...]) within Tracked Items
-        elif in_tracked_items_section and line.startswith('### ['):
-            current_item_title = line.replace('### ', '')
-            in_actions_section = False
-
-        # Check for Actions subsection
-        elif line.strip() == '#### Actions':
+        # Headings: one first-character test routes every non-heading line
+        # straight past the heading checks
+        if line.startswith('#'):
+            # Any h2 starts a new section; only the Tracked Items section
+            # (## 🔄 Tracked Items or ## Tracked Items) holds tracked items
+            if line.startswith('## '):
+                in_tracked_items_section = 'Tracked Items' in line
+                current_item_title = None
+                in_actions_section = False
+
+            # Check for item heading (### [...]) within Tracked Items
+            elif in_tracked_items_section and line.startswith('### ['):
+                current_item_title = line.replace('### ', '')
+                in_actions_section = False
+
+            # An h4 opens the Actions subsection or ends it
+            elif line.startswith('#### '):
+                in_actions_section = line.strip() == '#### Actions'
+
+        # Indented Actions heading (substring test first so ordinary
+        # lines skip the strip() copy)
+        elif '#### Actions' in line and line.strip() == '#### Actions':
             in_actions_section = True
 
-        # Check for any other h4 subsection (end of Actions)
-        elif line.startswith('#### ') and line.strip() != '#### Actions':
-            in_actions_section = False
-
-        # Check for completed tasks
-        elif line.startswith('- [x]'):
-            match = date_pattern.search(line)
+        # Check for completed tasks; only lines carrying a completion
+        # marker can match, so skip the regex for the rest
+        elif line.startswith('- [x]') and '✅' in line:
+            match = _COMPLETED_TASK_RE.match(line)
             if match:
                 task_date = match.group(1)
 
@@ -662,15 +958,20 @@ def extract_completed_tasks(content: str) -> Dict[str, Dict[str, List[str]]]:
                 else:
                     category = "Other"
 
-                if category not in completed_tasks:
-                    completed_tasks[category] = {}
+                bucket = flat_tasks.get((category, task_date))
+                if bucket is None:
+                    flat_tasks[(category, task_date)] = [line]
+                else:
+                    bucket.append(line)
+                continue
 
-                if task_date not in completed_tasks[category]:
-                    completed_tasks[category][task_date] = []
+        kept_lines.append(line)
 
-                completed_tasks[category][task_date].append(line)
+    completed_tasks: Dict[str, Dict[str, List[str]]] = {}
+    for (category, task_date), tasks in flat_tasks.items():
+        completed_tasks.setdefault(category, {})[task_date] = tasks
 
-    return completed_tasks
+    return completed_tasks, '\n'.join(kept_lines)
 
 
 def _extract_issue_key_from_title(item_title: str) -> Optional[str]:
@@ -682,10 +983,14 @@ def _extract_issue_key_from_title(item_title: str) -> Optional[str]:
     Returns:
         Issue key (e.g., 'ANSTRAT-1567') or None if not found
     """
-    match = re.match(r'\[([A-Z]+-\d+)\]', item_title)
+    # Titles without a leading '[' can't match; skip the regex for them
+    if not item_title.startswith('['):
+        return None
+    match = _ISSUE_KEY_RE.match(item_title)
     return match.group(1) if match else None
 
 
+@functools.lru_cache(maxsize=512)
 def _get_week_start(date_str: str) -> str:
     """Get the Monday of the week containing the given date.
 
@@ -695,11 +1000,10 @@ def _get_week_start(date_str: str) -> str:
     Returns:
         Monday's date in YYYY-MM-DD format
     """
-    from datetime import datetime as dt, timedelta
-    date = dt.strptime(date_str, "%Y-%m-%d")
+    day = date.fromisoformat(date_str)
     # Monday is weekday 0
-    monday = date - timedelta(days=date.weekday())
-    return monday.strftime("%Y-%m-%d")
+    monday = day - timedelta(days=day.weekday())
+    return monday.isoformat()
 
 
 def _format_issue_heading(item_title: str) -> str:
@@ -765,13 +1069,17 @@ def append_to_logbook(
     else:
         existing_content = "# Logbook\n"
 
-    # Parse existing logbook structure
-    existing_entries = _parse_logbook(existing_content)
+    # Parse existing logbook structure (or reuse the cached parse)
+    existing_entries = _load_logbook_entries(base_path, existing_content)
 
     # Merge new tasks into existing structure
     logged_count = 0
     initiatives_logged = set()
 
+    # Set of tasks already in each (week, initiative) bucket, built lazily
+    # so duplicate checks are O(1) instead of scanning the bucket's list
+    seen_tasks: Dict[Tuple[str, str], set] = {}
+
     for item_title, date_tasks in completed_tasks.items():
         issue_heading = _format_issue_heading(item_title)
 
@@ -784,23 +1092,113 @@ def append_to_logbook(
             if issue_heading not in existing_entries[week_start]:
                 existing_entries[week_start][issue_heading] = []
 
+            bucket = existing_entries[week_start][issue_heading]
+            bucket_key = (week_start, issue_heading)
+            if bucket_key not in seen_tasks:
+                seen_tasks[bucket_key] = set(bucket)
+            seen = seen_tasks[bucket_key]
+
             # Add tasks (avoiding duplicates)
             for task in tasks:
-                if task not in existing_entries[week_start][issue_heading]:
-                    existing_entries[week_start][issue_heading].append(task)
+                if task not in seen:
+                    bucket.append(task)
+                    seen.add(task)
                     logged_count += 1
 
             initiatives_logged.add(issue_heading)
 
+    # Nothing new to log: leave LOGBOOK.md untouched
+    if logged_count == 0:
+        return (0, len(initiatives_logged))
+
     # Rebuild logbook content
     new_content = _build_logbook_content(existing_entries)
 
-    # Write back
-    logbook_file.write_text(new_content)
+    # Write back atomically so an interrupted run can't truncate the logbook
+    _atomic_write_text(logbook_file, new_content)
+    _save_logbook_cache(base_path, new_content, existing_entries)
 
     return (logged_count, len(initiatives_logged))
 
 
+def _atomic_write_text(path: Path, content: str) -> None:
+    """Write text to a file via a temporary file and os.replace.
+
+    Readers see either the old or the new content, never a partial write.
+    No fsync is done; this protects against interrupted writes, not power loss.
+    Symlinks are followed so the link itself is kept, and an existing file's
+    permission bits carry over to the replacement.
+
+    Args:
+        path: File to write
+        content: Text content
+    """
+    path = Path(os.path.realpath(path))
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        # Encode once and write bytes: the files are small, so this is one
+        # write() with no text-layer buffering
+        tmp_path.write_bytes(content.encode("utf-8"))
+        try:
+            shutil.copymode(path, tmp_path)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _logbook_digest(content: str) -> str:
+    """Return a short content hash used to validate the logbook cache."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_logbook_entries(base_path: Path, content: str) -> Dict[str, Dict[str, List[str]]]:
+    """Return parsed LOGBOOK.md entries, using the sidecar cache if valid.
+
+    The cache, kept under $XDG_CACHE_HOME/gameplan, holds the entries from
+    the last logbook write along with a hash of the content written. If LOGBOOK.md has been edited since, the
+    hash no longer matches and the markdown is parsed again.
+
+    Args:
+        base_path: Base directory containing LOGBOOK.md
+        content: Current LOGBOOK.md content
+
+    Returns:
+        Dict mapping week_start -> initiative -> list of tasks
+    """
+    cache_file = cache_file_for(_LOGBOOK_CACHE_DIR, base_path / "LOGBOOK.md")
+    try:
+        cache = json.loads(cache_file.read_text())
+        if cache.get("hash") == _logbook_digest(content):
+            return cache["entries"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    return _parse_logbook(content)
+
+
+def _save_logbook_cache(
+    base_path: Path,
+    content: str,
+    entries: Dict[str, Dict[str, List[str]]],
+) -> None:
+    """Store parsed entries for the LOGBOOK.md content just written.
+
+    The cache is an optimization only, so write failures are ignored.
+    """
+    cache_file = cache_file_for(_LOGBOOK_CACHE_DIR, base_path / "LOGBOOK.md")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(
+            {"hash": _logbook_digest(content), "entries": entries},
+            ensure_ascii=False,
+        ))
+    except OSError:
+        pass
+
+
 def _parse_logbook(content: str) -> Dict[str, Dict[str, List[str]]]:
     """Parse existing LOGBOOK.md into structured data.
 
@@ -811,27 +1209,26 @@ def _parse_logbook(content: str) -> Dict[str, Dict[str, List[str]]]:
         Dict mapping week_start -> initiative -> list of tasks
     """
     entries: Dict[str, Dict[str, List[str]]] = {}
-    current_week: Optional[str] = None
-    current_initiative: Optional[str] = None
+    # Direct references to the current week's dict and initiative's task
+    # list, so task lines append without re-looking up both keys
+    current_week_entries: Optional[Dict[str, List[str]]] = None
+    current_tasks: Optional[List[str]] = None
 
-    for line in content.split('\n'):
+    for line in content.splitlines():
         # Week heading: ## Week of YYYY-MM-DD
         if line.startswith('## Week of '):
-            week_date = line.replace('## Week of ', '').strip()
-            current_week = week_date
-            current_initiative = None
-            if current_week not in entries:
-                entries[current_week] = {}
+            week = line[len('## Week of '):].strip()
+            current_week_entries = entries.setdefault(week, {}) if week else None
+            current_tasks = None
 
         # Initiative heading: ### ISSUE-KEY (Title) or ### Other
-        elif line.startswith('### ') and current_week:
-            current_initiative = line.replace('### ', '').strip()
-            if current_initiative not in entries[current_week]:
-                entries[current_week][current_initiative] = []
+        elif line.startswith('### ') and current_week_entries is not None:
+            initiative = line[len('### '):].strip()
+            current_tasks = current_week_entries.setdefault(initiative, []) if initiative else None
 
         # Task line
-        elif line.startswith('- [x]') and current_week and current_initiative:
-            entries[current_week][current_initiative].append(line)
+        elif line.startswith('- [x]') and current_tasks is not None:
+            current_tasks.append(line)
 
     return entries
 
@@ -871,21 +1268,24 @@ def _build_logbook_content(entries: Dict[str, Dict[str, List[str]]]) -> str:
             lines.append("")
 
             # Sort tasks by date (newest first within the week)
-            date_pattern = re.compile(r'✅ (\d{4}-\d{2}-\d{2})')
             sorted_tasks = sorted(
                 tasks,
-                key=lambda t: date_pattern.search(t).group(1) if date_pattern.search(t) else "",
+                key=_task_completion_date,
                 reverse=True
             )
 
-            for task in sorted_tasks:
-                lines.append(task)
-
+            lines.extend(sorted_tasks)
             lines.append("")
 
     return '\n'.join(lines)
 
 
+def _task_completion_date(task: str) -> str:
+    """Return the ✅ completion date of a task line, or '' if it has none."""
+    match = _COMPLETION_DATE_RE.search(task)
+    return match.group(1) if match else ""
+
+
 def remove_completed_tasks_from_content(
     content: str,
     completed_tasks: Dict[str, Dict[str, List[str]]]
@@ -903,22 +1303,18 @@ def remove_completed_tasks_from_content(
         return content
 
     # Build set of task lines to remove (for efficient lookup)
-    tasks_to_remove = set()
-    for date_tasks in completed_tasks.values():
-        for tasks in date_tasks.values():
-            for task in tasks:
-                tasks_to_remove.add(task)
-
-    # Filter out completed tasks
-    lines = content.split('\n')
-    filtered_lines = []
+    tasks_to_remove = {
+        task
+        for date_tasks in completed_tasks.values()
+        for tasks in date_tasks.values()
+        for task in tasks
+    }
 
-    for line in lines:
-        # Keep line if it's not a completed task to remove
-        if not (line.startswith('- [x]') and line in tasks_to_remove):
-            filtered_lines.append(line)
-
-    return '\n'.join(filtered_lines)
+    # Filter out completed tasks in a single pass. Splitting on '\n'
+    # (rather than splitlines) keeps a trailing newline intact on rejoin.
+    return '\n'.join(
+        line for line in content.split('\n') if line not in tasks_to_remove
+    )
 
 
 def process_logbook(base_path: Path) -> Tuple[int, int]:
@@ -942,19 +1338,41 @@ def process_logbook(base_path: Path) -> Tuple[int, int]:
 
     content = agenda_file.read_text()
 
-    # Extract completed tasks
-    completed_tasks = extract_completed_tasks(content)
+    updated_content, logged_count, initiatives_logged = _process_logbook_content(
+        content, base_path
+    )
+
+    if logged_count > 0:
+        _atomic_write_text(agenda_file, updated_content)
+
+    return (logged_count, initiatives_logged)
+
+
+def _process_logbook_content(content: str, base_path: Path) -> Tuple[str, int, int]:
+    """Log completed tasks from AGENDA.md content and strip them from it.
+
+    Works on content already in memory so callers that go on to modify
+    AGENDA.md can write it once instead of re-reading it.
+
+    Args:
+        content: AGENDA.md content
+        base_path: Base directory containing LOGBOOK.md
+
+    Returns:
+        Tuple of (updated_content, total_tasks_logged, initiatives_logged)
+    """
+    # Extract completed tasks, building the stripped content alongside
+    completed_tasks, stripped_content = _extract_and_strip(content)
     if not completed_tasks:
-        return (0, 0)
+        return (content, 0, 0)
 
     # Append to logbook
     logged_count, initiatives_logged = append_to_logbook(completed_tasks, base_path)
 
     if logged_count > 0:
         # Remove from agenda
-        updated_content = remove_completed_tasks_from_content(content, completed_tasks)
-        agenda_file.write_text(updated_content)
+        content = stripped_content
         print(f"📓 Logged {logged_count} completed task(s) to LOGBOOK.md")
         print(f"🧹 Removed {logged_count} completed task(s) from AGENDA.md")
 
-    return (logged_count, initiatives_logged)
+    return (content, logged_count, initiatives_logged)
@@ -0,0 +1,71 @@
+"""Caches shared by the gameplan commands.
+
+On-disk caches live under $XDG_CACHE_HOME/gameplan (default
+~/.cache/gameplan), never inside the gameplan repository itself.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+# Parsed files keyed by absolute path, each stored with the (mtime_ns, size)
+# it was parsed at so an edited file is always reparsed. abspath, unlike
+# resolve(), does not lstat every path component; a symlinked path just
+# gets its own entry.
+_memo: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def load_memoized(path: Path, parse: Callable[[bytes], Any]) -> Any:
+    """Parse a file, reusing the last result while the file is unchanged.
+
+    The same object is returned on every hit, so callers must treat it as
+    read-only. If parse raises, nothing is cached.
+
+    Args:
+        path: File to load
+        parse: Turns the file's bytes into the value to cache
+
+    Returns:
+        The parsed value
+
+    Raises:
+        FileNotFoundError: If path does not exist
+    """
+    stat = os.stat(path)
+    key = os.path.abspath(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _memo.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    value = parse(Path(path).read_bytes())
+    _memo[key] = (stamp, value)
+    return value
+
+
+def cache_dir(name: str) -> Path:
+    """Return the on-disk cache directory for one kind of cached data.
+
+    Args:
+        name: Subdirectory name, e.g. "commands"
+
+    Returns:
+        $XDG_CACHE_HOME/gameplan/<name>; the directory may not exist yet
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "gameplan" / name
+
+
+def cache_file_for(name: str, source: Path) -> Path:
+    """Return the JSON cache file for a file in a gameplan repository.
+
+    Args:
+        name: Cache subdirectory, see cache_dir
+        source: The file whose parsed content is cached
+
+    Returns:
+        A path in cache_dir(name) keyed by a hash of source's absolute path
+    """
+    digest = hashlib.sha256(os.path.abspath(source).encode()).hexdigest()
+    return cache_dir(name) / f"{digest}.json"
@@ -116,20 +116,21 @@ def cmd_sync(args):
     try:
         base_path = get_base_path()
         source = args.source if hasattr(args, "source") else None
+        force = args.force if hasattr(args, "force") else False
 
         if source == "jira":
             print("=" * 60)
             print("Jira Activity Sync")
             print("=" * 60)
             print()
-            sync.sync_jira(base_path)
+            sync.sync_jira(base_path, force=force)
         else:
             # Sync all (currently just Jira)
             print("=" * 60)
             print("Syncing All Adapters")
             print("=" * 60)
             print()
-            sync.sync_all(base_path)
+            sync.sync_all(base_path, force=force)
     except Exception as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -156,8 +157,12 @@ def cmd_jira(args):
         sys.exit(1)
 
 
-def main():
-    """Main CLI entry point."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the gameplan argument parser.
+
+    Returns:
+        Parser with every subcommand registered and bound to its handler
+    """
     parser = argparse.ArgumentParser(
         description="Gameplan - Local-first work tracking CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -245,6 +250,11 @@ def main():
         action="store_true",
         help="Enable debug logging",
     )
+    sync_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Fetch every issue in full, even ones unchanged on recent syncs",
+    )
     sync_parser.add_argument(
         "source",
         nargs="?",
@@ -281,6 +291,12 @@ def main():
     )
     populate_parser.set_defaults(func=cmd_jira)
 
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    parser = build_parser()
     args = parser.parse_args()
 
     # Configure logging based on -v flag
@@ -8,6 +8,58 @@ from typing import Optional
 
 import yaml
 
+# Written verbatim rather than dumped so the guidance comments survive
+_GAMEPLAN_YAML_TEMPLATE = """\
+# Gameplan Configuration
+# Track work items and generate daily AGENDA.md
+
+# Areas: Define what you want to track
+areas:
+  jira:
+    # Add Jira issues you're actively working on
+    items: []
+    # Example:
+    # items:
+    #   - issue: PROJ-123
+    #     env: prod
+    #   - issue: PROJ-456
+    #     env: staging
+    #
+    # Optional: Specify custom jirahhh command path
+    # command: /usr/local/bin/jirahhh
+
+# Agenda: Configure your daily AGENDA.md file
+agenda:
+  sections:
+    # Manual sections: You edit the content directly in AGENDA.md
+    - name: Focus & Priorities
+      emoji: 🎯
+      description: What's urgent/important today
+
+    # Command-driven sections: Auto-populated by running a command
+    # Uncomment to enable tracked items section:
+    # - name: Tracked Items
+    #   emoji: 🔄
+    #   command: gameplan agenda tracked-items
+    #   description: Current status of tracked items
+
+    # You can add custom command-driven sections:
+    # - name: Calendar
+    #   emoji: 📅
+    #   command: your-calendar-command
+    #   description: Today's meetings
+    #
+    # - name: Pull Requests
+    #   emoji: 📝
+    #   command: your-pr-command
+    #   description: PRs awaiting review
+
+    # Manual section for notes
+    - name: Notes
+      emoji: 📔
+      description: Thoughts and observations
+"""
+
 
 def init_gameplan(target_dir: Optional[Path | str] = None, interactive: bool = False) -> Path:
     """Initialize a new gameplan repository.
@@ -69,56 +121,5 @@ def _create_gameplan_yaml(config_file: Path) -> None:
     Args:
         config_file: Path to the gameplan.yaml file to create
     """
-    template = """\
-# Gameplan Configuration
-# Track work items and generate daily AGENDA.md
-
-# Areas: Define what you want to track
-areas:
-  jira:
-    # Add Jira issues you're actively working on
-    items: []
-    # Example:
-    # items:
-    #   - issue: PROJ-123
-    #     env: prod
-    #   - issue: PROJ-456
-    #     env: staging
-    #
-    # Optional: Specify custom jirahhh command path
-    # command: /usr/local/bin/jirahhh
-
-# Agenda: Configure your daily AGENDA.md file
-agenda:
-  sections:
-    # Manual sections: You edit the content directly in AGENDA.md
-    - name: Focus & Priorities
-      emoji: 🎯
-      description: What's urgent/important today
-
-    # Command-driven sections: Auto-populated by running a command
-    # Uncomment to enable tracked items section:
-    # - name: Tracked Items
-    #   emoji: 🔄
-    #   command: gameplan agenda tracked-items
-    #   description: Current status of tracked items
-
-    # You can add custom command-driven sections:
-    # - name: Calendar
-    #   emoji: 📅
-    #   command: your-calendar-command
-    #   description: Today's meetings
-    #
-    # - name: Pull Requests
-    #   emoji: 📝
-    #   command: your-pr-command
-    #   description: PRs awaiting review
-
-    # Manual section for notes
-    - name: Notes
-      emoji: 📔
-      description: Thoughts and observations
-"""
-
     with open(config_file, "w") as f:
-        f.write(template)
+        f.write(_GAMEPLAN_YAML_TEMPLATE)
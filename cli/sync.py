@@ -1,19 +1,37 @@
 """Sync command for pulling data from external systems."""
 
+import hashlib
+import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import yaml
-from ruamel.yaml import YAML
 
+from cli.adapters.base import ItemData, TrackedItem
 from cli.adapters.jira import JiraAdapter
 from cli.adapters.misc import MiscAdapter
+from cli.cache import cache_file_for, load_memoized
+
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# The parsed gameplan.yaml is also cached as JSON, validated by a hash of
+# the YAML bytes, so a fresh process can skip YAML parsing
+_CONFIG_CACHE_DIR = "config"
+_NO_CACHE = object()
 
 
 def load_config(base_path: Path) -> Dict[str, Any]:
     """Load gameplan.yaml configuration.
 
+    The parsed config is memoized until the file's mtime or size changes,
+    so sync_jira, sync_misc and populate share one parse per run; callers
+    must treat it as read-only. It is also cached as JSON under
+    $XDG_CACHE_HOME/gameplan, validated by a hash of the YAML, which later
+    runs load instead of parsing an unchanged file.
+
     Args:
         base_path: Base directory containing gameplan.yaml
 
@@ -22,12 +40,57 @@ def load_config(base_path: Path) -> Dict[str, Any]:
     """
     config_file = base_path / "gameplan.yaml"
 
-    if not config_file.exists():
+    try:
+        return load_memoized(config_file, lambda raw: _parse_config(config_file, raw))
+    except FileNotFoundError:
         print(f"⚠️  Configuration not found: {config_file}", file=sys.stderr)
         return {}
 
-    with open(config_file) as f:
-        return yaml.safe_load(f)
+
+def _parse_config(config_file: Path, raw: bytes) -> Any:
+    """Parse gameplan.yaml bytes, going through the JSON cache when valid."""
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    config = _load_config_cache(config_file, digest)
+    if config is _NO_CACHE:
+        # Same result as agenda's parser, which shares the memo: {} when empty
+        config = yaml.load(raw, Loader=_YAML_LOADER) or {}
+        _save_config_cache(config_file, digest, config)
+    return config
+
+
+def _load_config_cache(config_file: Path, digest: str) -> Any:
+    """Return the config cached for config_file if it matches digest.
+
+    Returns:
+        The cached config, or _NO_CACHE if the cache is missing, stale
+        or unreadable
+    """
+    try:
+        cache = json.loads(cache_file_for(_CONFIG_CACHE_DIR, config_file).read_bytes())
+        if cache.get("hash") == digest:
+            return cache["config"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    return _NO_CACHE
+
+
+def _save_config_cache(config_file: Path, digest: str, config: Any) -> None:
+    """Cache the parsed config for config_file content with the given digest.
+
+    Configs that do not survive a JSON round trip unchanged (dates, non-string
+    keys) are not cached. The cache is an optimization only, so write
+    failures are ignored.
+    """
+    try:
+        payload = json.dumps({"hash": digest, "config": config}, ensure_ascii=False)
+        if json.loads(payload)["config"] != config:
+            return
+        cache_file = cache_file_for(_CONFIG_CACHE_DIR, config_file)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(payload.encode("utf-8"))
+    except (OSError, TypeError, ValueError):
+        pass
 
 
 def save_config(base_path: Path, items: List[Dict[str, Any]]) -> None:
@@ -40,6 +103,9 @@ def save_config(base_path: Path, items: List[Dict[str, Any]]) -> None:
         base_path: Base directory containing gameplan.yaml
         items: List of item dicts to write to areas.jira.items
     """
+    # Only populate writes the config; keep ruamel off every CLI startup
+    from ruamel.yaml import YAML
+
     config_file = base_path / "gameplan.yaml"
 
     ryaml = YAML()
@@ -54,11 +120,15 @@ def save_config(base_path: Path, items: List[Dict[str, Any]]) -> None:
         ryaml.dump(data, f)
 
 
-def sync_jira(base_path: Path) -> None:
+def sync_jira(base_path: Path, force: bool = False) -> None:
     """Sync Jira issues and update README files.
 
+    Issues that have come back unchanged on recent syncs are skipped until
+    their poll interval is up (see JiraAdapter.is_poll_due).
+
     Args:
         base_path: Base directory for gameplan repository
+        force: Fetch every issue in full, ignoring poll intervals
     """
     print("Loading tracked Jira issues from gameplan.yaml...")
     config = load_config(base_path)
@@ -69,6 +139,11 @@ def sync_jira(base_path: Path) -> None:
         print("⚠️  No Jira configuration found in gameplan.yaml!")
         return
 
+    # Nothing listed means nothing to sync; don't build the adapter for it
+    if not jira_config.get("items"):
+        print("⚠️  No tracked Jira issues found in gameplan.yaml!")
+        return
+
     # Create adapter
     adapter = JiraAdapter(jira_config, base_path)
 
@@ -82,20 +157,65 @@ def sync_jira(base_path: Path) -> None:
     print(f"Found {len(tracked_items)} tracked Jira issue(s)")
     print("\nChecking Jira issues...")
 
-    for item in tracked_items:
-        print(f"  Checking {item.id}...")
+    # Find existing READMEs by searching for {issue_key}-* directories; their
+    # metadata says which issues are due for a fetch
+    existing_readmes = {item.id: adapter.find_readme_path(item) for item in tracked_items}
+    due_items = [
+        item
+        for item in tracked_items
+        if force
+        or existing_readmes[item.id] is None
+        or adapter.is_poll_due(existing_readmes[item.id])
+    ]
+
+    # Jira's "updated" stamp from each issue's last sync. Fetches flag
+    # issues still carrying theirs as not_modified, which skips the README
+    # rewrite and, per issue, the comments call; --force refreshes everything
+    last_updated = {}
+    if not force:
+        for item in due_items:
+            if existing_readmes[item.id] is not None:
+                metadata = adapter.load_metadata(existing_readmes[item.id])
+                last_updated[item.id] = metadata.get("updated")
+
+    # One JQL search covers most issues. Anything it missed is fetched per
+    # issue, a pair of jirahhh round trips each, so overlap those. The
+    # README updates below stay serial, in config order.
+    fetched = (
+        dict(adapter.fetch_items_bulk(due_items, since=last_updated))
+        if len(due_items) > 1
+        else {}
+    )
+    missing = [item for item in due_items if item.id not in fetched]
+
+    def fetch(item: TrackedItem) -> ItemData:
+        return adapter.fetch_item_data(item, since=last_updated.get(item.id))
+
+    if len(missing) == 1:
+        fetched[missing[0].id] = fetch(missing[0])
+    elif missing:
+        with ThreadPoolExecutor(max_workers=min(16, len(missing))) as executor:
+            fetched.update(zip(
+                (item.id for item in missing), executor.map(fetch, missing), strict=True
+            ))
 
-        # Find existing README by searching for {issue_key}-* directories
-        existing_readme = adapter.find_readme_path(item)
-        readme_path = existing_readme or adapter.get_storage_path(item, title=None)
+    for item in tracked_items:
+        if item.id not in fetched:
+            print(f"  Skipping {item.id} (unchanged on recent syncs; --force to check now)")
+            continue
 
-        # Fetch data from Jira
-        data = adapter.fetch_item_data(item)
+        data = fetched[item.id]
+        print(f"  Checking {item.id}...")
 
         if not data.title:
             print("    ⚠️  Could not fetch data")
             continue
 
+        # Fall back to where the current title puts the README
+        existing_readme = existing_readmes[item.id]
+        new_readme_path = adapter.get_storage_path(item, title=data.title)
+        readme_path = existing_readme or new_readme_path
+
         # Extract assignee from raw data
         assignee = "Unassigned"
         if "fields" in data.raw_data:
@@ -115,16 +235,14 @@ def sync_jira(base_path: Path) -> None:
         else:
             print(f"    ✓ Status: {data.status} | Assignee: {assignee}")
 
-        # Get the desired path based on current title
-        new_readme_path = adapter.get_storage_path(item, title=data.title)
-
         # Handle directory rename if Jira title changed
         if existing_readme and existing_readme.parent != new_readme_path.parent:
             print(f"    📁 Title changed, renaming directory")
             existing_readme.parent.rename(new_readme_path.parent)
 
-        # Update the README.md with new status
-        adapter.update_readme(new_readme_path, data, item)
+        # Update the README.md with new status, unless Jira says nothing changed
+        if not data.not_modified:
+            adapter.update_readme(new_readme_path, data, item)
 
         # Save metadata for next sync
         adapter.save_metadata(new_readme_path, data)
@@ -168,13 +286,14 @@ def sync_misc(base_path: Path) -> None:
     print("\n✓ Misc sync complete!")
 
 
-def sync_all(base_path: Path) -> None:
+def sync_all(base_path: Path, force: bool = False) -> None:
     """Sync all configured adapters.
 
     Args:
         base_path: Base directory for gameplan repository
+        force: Fetch every Jira issue, ignoring poll intervals
     """
-    sync_jira(base_path)
+    sync_jira(base_path, force=force)
     sync_misc(base_path)
 
 
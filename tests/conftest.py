@@ -1,19 +1,45 @@
 """Shared fixtures for gameplan tests."""
-import shutil
-import tempfile
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Union
 
 import pytest
 import yaml
 
+# libyaml-backed loader/dumper when PyYAML was built with it, like cli.agenda
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory that's cleaned up after the test."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path)
+def temp_dir(tmp_path_factory):
+    """Create a fresh temporary directory for the test.
+
+    Directories are numbered under pytest's session base temp, which
+    pytest prunes itself, so there is no per-test rmtree.
+    """
+    return tmp_path_factory.mktemp("gp", numbered=True)
+
+
+@pytest.fixture(scope="session")
+def cache_home(tmp_path_factory):
+    """Session-wide stand-in for $XDG_CACHE_HOME."""
+    return tmp_path_factory.mktemp("cache")
+
+
+@pytest.fixture(autouse=True)
+def isolate_cache_home(monkeypatch, cache_home):
+    """Keep the on-disk caches tests write out of the real ~/.cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+
+
+@pytest.fixture(scope="module")
+def empty_dir(tmp_path_factory):
+    """Create an empty directory shared by the tests in a module.
+
+    For tests that only check behavior when files are missing; tests
+    must not write to it.
+    """
+    return tmp_path_factory.mktemp("empty", numbered=True)
 
 
 @pytest.fixture
@@ -32,12 +58,36 @@ def sample_config() -> Dict[str, Any]:
 
 
 @pytest.fixture
-def config_file(temp_dir, sample_config):
+def write_config(temp_dir):
+    """Return a function that writes a config to temp_dir/gameplan.yaml.
+
+    The config may be a dict, which is dumped as YAML, or a YAML string,
+    which is written as-is.
+    """
+    def _write(config: Union[Dict[str, Any], str]) -> Path:
+        config_path = temp_dir / "gameplan.yaml"
+        if not isinstance(config, str):
+            config = yaml.dump(config, Dumper=YAML_DUMPER)
+        config_path.write_bytes(config.encode("utf-8"))
+        return config_path
+
+    return _write
+
+
+@pytest.fixture
+def read_yaml():
+    """Return a function that parses a YAML file with YAML_LOADER."""
+    def _read(path: Path) -> Any:
+        with open(path) as f:
+            return yaml.load(f, Loader=YAML_LOADER)
+
+    return _read
+
+
+@pytest.fixture
+def config_file(write_config, sample_config):
     """Create a temporary gameplan.yaml file."""
-    config_path = temp_dir / "gameplan.yaml"
-    with open(config_path, "w") as f:
-        yaml.dump(sample_config, f)
-    return config_path
+    return write_config(sample_config)
 
 
 @pytest.fixture
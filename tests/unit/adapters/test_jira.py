@@ -5,7 +5,7 @@ The Jira adapter integrates with Jira via the jirahhh CLI tool
 """
 
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -112,10 +112,41 @@ class TestJiraFetchItemData:
         assert mock_run.call_count == 2
         # Check first call is for issue data
         assert "jirahhh" in mock_run.call_args_list[0][0][0]
-        assert "/rest/api/2/issue/PROJ-123" in mock_run.call_args_list[0][0][0]
+        assert "/rest/api/2/issue/PROJ-123?fields=summary,status,assignee,updated" in (
+            mock_run.call_args_list[0][0][0]
+        )
         # Check second call is for comments
         assert "/rest/api/2/issue/PROJ-123/comment" in mock_run.call_args_list[1][0][0]
 
+    @pytest.mark.parametrize(
+        "since, not_modified",
+        [("2025-01-01T00:00:00.000+0000", True), ("2024-12-31T00:00:00.000+0000", False)],
+        ids=["unchanged", "changed"],
+    )
+    @patch("subprocess.run")
+    def test_fetch_item_data_skips_comments_when_not_modified(
+        self, mock_run, temp_dir, since, not_modified
+    ):
+        """fetch_item_data skips the comments call if "updated" still matches since."""
+        mock_run.side_effect = [
+            MagicMock(
+                returncode=0,
+                stdout=json.dumps(
+                    {"fields": {"summary": "Test Issue", "updated": "2025-01-01T00:00:00.000+0000"}}
+                ),
+            ),
+            MagicMock(returncode=0, stdout=json.dumps({"comments": []})),
+        ]
+
+        adapter = JiraAdapter({}, temp_dir)
+        item = TrackedItem(id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123"})
+
+        data = adapter.fetch_item_data(item, since=since)
+
+        assert data.title == "Test Issue"
+        assert data.not_modified is not_modified
+        assert mock_run.call_count == (1 if not_modified else 2)
+
     @patch("subprocess.run")
     def test_fetch_item_data_returns_item_data(self, mock_run, temp_dir):
         """fetch_item_data returns ItemData with parsed info."""
@@ -188,6 +219,127 @@ class TestJiraFetchItemData:
         assert data.status == "Open"
 
 
+class TestJiraFetchItemsBulk:
+    """Test fetching several Jira issues with one search."""
+
+    @patch("subprocess.run")
+    def test_fetch_items_bulk_runs_one_search_per_env(self, mock_run, temp_dir):
+        """fetch_items_bulk fetches all issues in an env with one JQL search."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=json.dumps(
+                {
+                    "issues": [
+                        {
+                            "key": "PROJ-123",
+                            "fields": {
+                                "summary": "First",
+                                "status": {"name": "Open"},
+                                "comment": {"comments": [{"body": "hi"}], "total": 1},
+                            },
+                        },
+                        {
+                            "key": "PROJ-456",
+                            "fields": {"summary": "Second", "status": {"name": "Done"}},
+                        },
+                    ]
+                }
+            ),
+        )
+
+        adapter = JiraAdapter({}, temp_dir)
+        items = [
+            TrackedItem(id=key, adapter="jira", metadata={"issue": key, "env": "prod"})
+            for key in ("PROJ-123", "PROJ-456")
+        ]
+
+        fetched = adapter.fetch_items_bulk(items)
+
+        assert mock_run.call_count == 1
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:3] == ["jirahhh", "api", "GET"]
+        assert cmd[3].startswith("/rest/api/2/search?")
+        assert "issue+in+%28PROJ-123%2C+PROJ-456%29" in cmd[3]
+        assert "fields=summary%2Cstatus%2Cassignee%2Cupdated%2Ccomment" in cmd[3]
+        assert cmd[-2:] == ["--env", "prod"]
+
+        assert fetched["PROJ-123"].title == "First"
+        assert fetched["PROJ-123"].status == "Open"
+        assert fetched["PROJ-123"].raw_data["comments"]["comments"] == [{"body": "hi"}]
+        assert fetched["PROJ-456"].status == "Done"
+
+    @patch("subprocess.run")
+    def test_fetch_items_bulk_skips_truncated_comments(self, mock_run, temp_dir):
+        """fetch_items_bulk leaves out issues whose embedded comments are partial."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=json.dumps(
+                {
+                    "issues": [
+                        {
+                            "key": "PROJ-123",
+                            "fields": {
+                                "summary": "Busy",
+                                "comment": {"comments": [{"body": "1"}], "total": 80},
+                            },
+                        },
+                    ]
+                }
+            ),
+        )
+
+        adapter = JiraAdapter({}, temp_dir)
+        item = TrackedItem(id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123"})
+
+        assert adapter.fetch_items_bulk([item]) == {}
+
+    @patch("subprocess.run")
+    def test_fetch_items_bulk_marks_issues_not_modified_since(self, mock_run, temp_dir):
+        """fetch_items_bulk flags issues whose "updated" still matches since."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=json.dumps(
+                {
+                    "issues": [
+                        {
+                            "key": key,
+                            "fields": {"summary": key, "updated": "2025-01-15T10:00:00.000+0000"},
+                        }
+                        for key in ("PROJ-123", "PROJ-456", "PROJ-789")
+                    ]
+                }
+            ),
+        )
+
+        adapter = JiraAdapter({}, temp_dir)
+        items = [
+            TrackedItem(id=key, adapter="jira", metadata={"issue": key})
+            for key in ("PROJ-123", "PROJ-456", "PROJ-789")
+        ]
+
+        fetched = adapter.fetch_items_bulk(
+            items,
+            since={
+                "PROJ-123": "2025-01-15T10:00:00.000+0000",
+                "PROJ-456": "2025-01-14T10:00:00.000+0000",
+            },
+        )
+
+        assert fetched["PROJ-123"].not_modified is True
+        assert fetched["PROJ-456"].not_modified is False
+        assert fetched["PROJ-789"].not_modified is False
+
+    @patch("subprocess.run")
+    def test_fetch_items_bulk_returns_empty_on_error(self, mock_run, temp_dir):
+        """fetch_items_bulk returns nothing for an env whose search fails."""
+        mock_run.return_value = MagicMock(returncode=1, stdout="")
+
+        adapter = JiraAdapter({}, temp_dir)
+        item = TrackedItem(id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123"})
+
+        assert adapter.fetch_items_bulk([item]) == {}
+
+
 class TestJiraStoragePath:
     """Test Jira README.md storage path generation."""
 
@@ -517,6 +669,32 @@ class TestJiraMetadata:
 
         assert result == {}
 
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_metadata_round_trips_with_either_json_backend(
+        self, temp_dir, monkeypatch, use_orjson
+    ):
+        """Metadata written by save_metadata reads back with or without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("cli.adapters.jira.orjson", None)
+        adapter = JiraAdapter({}, temp_dir)
+        readme_path = temp_dir / "tracking/areas/jira/PROJ-123/README.md"
+        readme_path.parent.mkdir(parents=True)
+
+        data = ItemData(
+            title="Test Issue",
+            status="Open",
+            raw_data={"fields": {"updated": "2025-01-15T10:00:00.000+0000"}},
+        )
+
+        adapter.save_metadata(readme_path, data)
+
+        metadata_path = readme_path.parent / ".metadata.json"
+        assert metadata_path.read_text().startswith('{\n  "last_sync": ')
+        assert adapter.load_metadata(readme_path) == json.loads(metadata_path.read_text())
+        assert adapter.load_metadata(readme_path)["updated"] == "2025-01-15T10:00:00.000+0000"
+
 
 class TestJiraChangeDetection:
     """Test change detection logic."""
@@ -581,6 +759,58 @@ class TestJiraChangeDetection:
         assert has_changes is True
 
 
+class TestJiraAdaptivePolling:
+    """Test poll intervals for issues that keep coming back unchanged."""
+
+    def test_save_metadata_counts_quiet_syncs(self, temp_dir):
+        """save_metadata counts unchanged syncs in a row and resets on change."""
+        adapter = JiraAdapter({}, temp_dir)
+        readme_path = temp_dir / "tracking/areas/jira/PROJ-123/README.md"
+        readme_path.parent.mkdir(parents=True)
+
+        def sync(updated):
+            data = ItemData(title="Test", status="Open", raw_data={"fields": {"updated": updated}})
+            adapter.save_metadata(readme_path, data)
+            return adapter.load_metadata(readme_path)["quiet_syncs"]
+
+        assert sync("2025-01-15T10:00:00.000+0000") == 0
+        assert sync("2025-01-15T10:00:00.000+0000") == 1
+        assert sync("2025-01-15T10:00:00.000+0000") == 2
+        assert sync("2025-01-16T10:00:00.000+0000") == 0
+
+    def test_is_poll_due_without_metadata(self, temp_dir):
+        """Issues never synced before are always due."""
+        adapter = JiraAdapter({}, temp_dir)
+
+        assert adapter.is_poll_due(temp_dir / "tracking/areas/jira/PROJ-123/README.md")
+
+    @pytest.mark.parametrize(
+        "quiet_syncs, minutes_since_sync, expected",
+        [
+            (0, 0, False),
+            (0, 4, False),
+            (0, 5, True),
+            (2, 19, False),
+            (2, 20, True),
+            (10, 59, False),
+            (10, 60, True),
+        ],
+    )
+    def test_is_poll_due_backs_off_exponentially(
+        self, temp_dir, quiet_syncs, minutes_since_sync, expected
+    ):
+        """The wait doubles per quiet sync from five minutes, capped at an hour."""
+        adapter = JiraAdapter({}, temp_dir)
+        readme_path = temp_dir / "tracking/areas/jira/PROJ-123/README.md"
+        readme_path.parent.mkdir(parents=True)
+        last_sync = datetime(2025, 1, 15, 10, 0)
+        (readme_path.parent / ".metadata.json").write_text(
+            json.dumps({"last_sync": last_sync.isoformat(), "quiet_syncs": quiet_syncs})
+        )
+
+        now = last_sync + timedelta(minutes=minutes_since_sync)
+        assert adapter.is_poll_due(readme_path, now=now) is expected
+
 class TestJirahhhCustomCommand:
     """Test custom command configuration."""
 
@@ -835,3 +1065,74 @@ class TestJiraSearchIssues:
         call_args = mock_run.call_args[0][0]
         assert "--max-results" in call_args
         assert "10" in call_args
+
+
+class TestReadFrontmatterFields:
+    """Test read_frontmatter_fields helper."""
+
+    def test_reads_plain_scalar_fields(self):
+        """Reads requested plain fields without parsing the rest."""
+        from cli.adapters.jira import read_frontmatter_fields
+
+        content = """---
+issue_key: PROJ-123
+title: Test Issue
+status: In Progress
+comments:
+- author: Someone
+  body: "line one\\nline two"
+---
+# PROJ-123: Test Issue
+"""
+
+        result = read_frontmatter_fields(content, ["title", "status"])
+
+        assert result == {"title": "Test Issue", "status": "In Progress"}
+
+    def test_falls_back_to_yaml_for_quoted_values(self):
+        """Quoted values are decoded by the full YAML parser."""
+        from cli.adapters.jira import read_frontmatter_fields
+
+        content = """---
+title: 'Fix: it''s broken'
+status: Done
+---
+"""
+
+        result = read_frontmatter_fields(content, ["title", "status"])
+
+        assert result == {"title": "Fix: it's broken", "status": "Done"}
+
+    def test_resolves_non_string_plain_scalars(self):
+        """Plain values are typed the same way a full YAML parse types them."""
+        from cli.adapters.jira import read_frontmatter_fields
+
+        content = """---
+empty: null
+tilde: ~
+count: 123
+ratio: 1.5
+done: true
+closed: False
+title: Test Issue
+---
+"""
+        keys = ["empty", "tilde", "count", "ratio", "done", "closed", "title"]
+
+        result = read_frontmatter_fields(content, keys)
+
+        assert result == {
+            "empty": None,
+            "tilde": None,
+            "count": 123,
+            "ratio": 1.5,
+            "done": True,
+            "closed": False,
+            "title": "Test Issue",
+        }
+
+    def test_returns_empty_without_frontmatter(self):
+        """Content without frontmatter yields no fields."""
+        from cli.adapters.jira import read_frontmatter_fields
+
+        assert read_frontmatter_fields("# Just a heading\n", ["title"]) == {}
@@ -7,11 +7,12 @@ Some sections are manual (user-maintained), others are command-driven
 Also includes tests for logbook functionality - automatic archival of
 completed tasks to LOGBOOK.md files.
 """
+import re
 from pathlib import Path
 from datetime import datetime
+from unittest.mock import Mock
 
 import pytest
-import yaml
 
 from cli.agenda import (
     init_agenda,
@@ -27,26 +28,35 @@ from cli.agenda import (
     _parse_logbook,
     _build_logbook_content,
 )
+from cli.cache import cache_file_for
+
+# Minimal agenda config with a single manual section
+FOCUS_CONFIG = {
+    "agenda": {
+        "sections": [
+            {"name": "Focus", "description": "Today's focus"}
+        ]
+    }
+}
+
+# Config tracking one Jira issue, written verbatim
+SINGLE_JIRA_ITEM_CONFIG = """
+areas:
+  jira:
+    items:
+      - issue: PROJ-123
+        env: prod
+"""
 
 
 class TestInitAgenda:
     """Test agenda initialization."""
 
-    def test_init_creates_agenda_file(self, temp_dir, monkeypatch):
+    def test_init_creates_agenda_file(self, temp_dir, write_config, monkeypatch):
         """Init creates AGENDA.md file."""
         monkeypatch.chdir(temp_dir)
 
-        # Create minimal config
-        config = {
-            "agenda": {
-                "sections": [
-                    {"name": "Focus", "description": "Today's focus"}
-                ]
-            }
-        }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(FOCUS_CONFIG)
 
         init_agenda()
 
@@ -54,20 +64,11 @@ class TestInitAgenda:
         assert agenda_file.exists()
         assert agenda_file.is_file()
 
-    def test_init_agenda_has_date_header(self, temp_dir, monkeypatch):
+    def test_init_agenda_has_date_header(self, temp_dir, write_config, monkeypatch):
         """Init creates AGENDA.md with date header."""
         monkeypatch.chdir(temp_dir)
 
-        config = {
-            "agenda": {
-                "sections": [
-                    {"name": "Focus", "description": "Today's focus"}
-                ]
-            }
-        }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(FOCUS_CONFIG)
 
         init_agenda()
 
@@ -75,7 +76,7 @@ class TestInitAgenda:
         today = datetime.now().strftime("%A, %B %d, %Y")
         assert f"# Agenda - {today}" in content
 
-    def test_init_creates_manual_section(self, temp_dir, monkeypatch):
+    def test_init_creates_manual_section(self, temp_dir, write_config, monkeypatch):
         """Init creates manual section with description."""
         monkeypatch.chdir(temp_dir)
 
@@ -90,9 +91,7 @@ class TestInitAgenda:
                 ]
             }
         }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(config)
 
         init_agenda()
 
@@ -100,7 +99,7 @@ class TestInitAgenda:
         assert "## 🎯 Focus & Priorities" in content
         assert "[What's urgent today]" in content
 
-    def test_init_creates_command_driven_section(self, temp_dir, monkeypatch):
+    def test_init_creates_command_driven_section(self, temp_dir, write_config, monkeypatch):
         """Init creates command-driven section with command marker."""
         monkeypatch.chdir(temp_dir)
 
@@ -116,9 +115,7 @@ class TestInitAgenda:
                 ]
             }
         }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(config)
 
         init_agenda()
 
@@ -126,7 +123,7 @@ class TestInitAgenda:
         assert "## 📅 Calendar" in content
         assert "[Run: echo 'No meetings']" in content
 
-    def test_init_creates_section_without_emoji(self, temp_dir, monkeypatch):
+    def test_init_creates_section_without_emoji(self, temp_dir, write_config, monkeypatch):
         """Init creates section without emoji if not specified."""
         monkeypatch.chdir(temp_dir)
 
@@ -137,9 +134,7 @@ class TestInitAgenda:
                 ]
             }
         }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(config)
 
         init_agenda()
 
@@ -147,7 +142,7 @@ class TestInitAgenda:
         assert "## Notes" in content
         assert "[Observations]" in content
 
-    def test_init_creates_multiple_sections(self, temp_dir, monkeypatch):
+    def test_init_creates_multiple_sections(self, temp_dir, write_config, monkeypatch):
         """Init creates multiple sections in order."""
         monkeypatch.chdir(temp_dir)
 
@@ -160,36 +155,20 @@ class TestInitAgenda:
                 ]
             }
         }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(config)
 
         init_agenda()
 
         content = (temp_dir / "AGENDA.md").read_text()
-        # Check all sections present
-        assert "## Focus" in content
-        assert "## Calendar" in content
-        assert "## Notes" in content
-
-        # Check order
-        focus_pos = content.find("## Focus")
-        calendar_pos = content.find("## Calendar")
-        notes_pos = content.find("## Notes")
-        assert focus_pos < calendar_pos < notes_pos
+        # Check all sections present, in order
+        headings = re.findall(r"^## (\w+)$", content, re.MULTILINE)
+        assert headings == ["Focus", "Calendar", "Notes"]
 
-    def test_init_raises_error_if_agenda_exists(self, temp_dir, monkeypatch):
+    def test_init_raises_error_if_agenda_exists(self, temp_dir, write_config, monkeypatch):
         """Init raises FileExistsError if AGENDA.md already exists."""
         monkeypatch.chdir(temp_dir)
 
-        config = {
-            "agenda": {
-                "sections": [{"name": "Focus", "description": "Focus"}]
-            }
-        }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(FOCUS_CONFIG)
 
         # First init succeeds
         init_agenda()
@@ -198,21 +177,28 @@ class TestInitAgenda:
         with pytest.raises(FileExistsError, match="AGENDA.md already exists"):
             init_agenda()
 
-    def test_init_raises_error_if_no_config(self, temp_dir, monkeypatch):
+    def test_init_raises_error_if_no_config(self, empty_dir, monkeypatch):
         """Init raises FileNotFoundError if gameplan.yaml missing."""
-        monkeypatch.chdir(temp_dir)
+        monkeypatch.chdir(empty_dir)
 
         with pytest.raises(FileNotFoundError, match="gameplan.yaml not found"):
             init_agenda()
 
-    def test_init_raises_error_if_no_agenda_section(self, temp_dir, monkeypatch):
+    def test_init_raises_error_if_no_agenda_section(self, temp_dir, write_config, monkeypatch):
         """Init raises ValueError if config missing agenda section."""
         monkeypatch.chdir(temp_dir)
 
         config = {"areas": {"jira": {"items": []}}}
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(config)
+
+        with pytest.raises(ValueError, match="No 'agenda' section"):
+            init_agenda()
+
+    def test_init_raises_error_if_config_empty(self, temp_dir, monkeypatch):
+        """Init raises ValueError if gameplan.yaml is empty."""
+        monkeypatch.chdir(temp_dir)
+
+        (temp_dir / "gameplan.yaml").write_text("")
 
         with pytest.raises(ValueError, match="No 'agenda' section"):
             init_agenda()
@@ -232,9 +218,9 @@ class TestViewAgenda:
 
         assert result == agenda_content
 
-    def test_view_raises_error_if_no_agenda(self, temp_dir, monkeypatch):
+    def test_view_raises_error_if_no_agenda(self, empty_dir, monkeypatch):
         """View raises FileNotFoundError if AGENDA.md missing."""
-        monkeypatch.chdir(temp_dir)
+        monkeypatch.chdir(empty_dir)
 
         with pytest.raises(FileNotFoundError, match="AGENDA.md not found"):
             view_agenda()
@@ -243,7 +229,7 @@ class TestViewAgenda:
 class TestRefreshAgenda:
     """Test refreshing command-driven sections."""
 
-    def test_refresh_updates_command_section(self, temp_dir, monkeypatch):
+    def test_refresh_updates_command_section(self, temp_dir, write_config, monkeypatch):
         """Refresh updates command-driven section with command output."""
         monkeypatch.chdir(temp_dir)
 
@@ -258,9 +244,7 @@ class TestRefreshAgenda:
                 ]
             }
         }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(config)
 
         # Create AGENDA.md with placeholder
         agenda_content = """# Agenda
@@ -277,7 +261,7 @@ class TestRefreshAgenda:
         assert "Current time" in updated_content
         assert "[Run: echo 'Current time']" not in updated_content
 
-    def test_refresh_preserves_manual_sections(self, temp_dir, monkeypatch):
+    def test_refresh_preserves_manual_sections(self, temp_dir, write_config, monkeypatch):
         """Refresh preserves manual section content."""
         monkeypatch.chdir(temp_dir)
 
@@ -289,9 +273,7 @@ class TestRefreshAgenda:
                 ]
             }
         }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(config)
 
         # Create AGENDA.md with manual content
         agenda_content = """# Agenda
@@ -314,7 +296,7 @@ class TestRefreshAgenda:
         # Command output should be added
         assert "Now" in updated_content
 
-    def test_refresh_handles_multiple_command_sections(self, temp_dir, monkeypatch):
+    def test_refresh_handles_multiple_command_sections(self, temp_dir, write_config, monkeypatch):
         """Refresh updates multiple command-driven sections."""
         monkeypatch.chdir(temp_dir)
 
@@ -327,9 +309,7 @@ class TestRefreshAgenda:
                 ]
             }
         }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(config)
 
         agenda_content = """# Agenda
 
@@ -351,7 +331,36 @@ Manual content here
         assert "10:00" in updated_content
         assert "Manual content here" in updated_content
 
-    def test_refresh_raises_error_if_no_agenda(self, temp_dir, monkeypatch):
+    def test_refresh_places_concurrent_output_in_matching_sections(self, temp_dir, write_config, monkeypatch):
+        """Refresh keeps each command's output in its own section when run concurrently."""
+        monkeypatch.chdir(temp_dir)
+
+        config = {
+            "agenda": {
+                "sections": [
+                    {"name": "Slow", "command": "sleep 0.2; echo 'slow output'"},
+                    {"name": "Fast", "command": "echo 'fast output'"}
+                ]
+            }
+        }
+        write_config(config)
+
+        (temp_dir / "AGENDA.md").write_text("""# Agenda
+
+## Slow
+[Run: sleep 0.2; echo 'slow output']
+
+## Fast
+[Run: echo 'fast output']
+""")
+
+        refresh_agenda()
+
+        updated_content = (temp_dir / "AGENDA.md").read_text()
+        assert "## Slow\nslow output\n" in updated_content
+        assert "## Fast\nfast output\n" in updated_content
+
+    def test_refresh_raises_error_if_no_agenda(self, temp_dir, write_config, monkeypatch):
         """Refresh raises FileNotFoundError if AGENDA.md missing."""
         monkeypatch.chdir(temp_dir)
 
@@ -361,9 +370,7 @@ Manual content here
                 "sections": [{"name": "Test", "command": "echo 'test'"}]
             }
         }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(config)
 
         with pytest.raises(FileNotFoundError, match="AGENDA.md not found"):
             refresh_agenda()
@@ -377,7 +384,7 @@ Manual content here
         with pytest.raises(FileNotFoundError, match="gameplan.yaml not found"):
             refresh_agenda()
 
-    def test_refresh_handles_command_failure_gracefully(self, temp_dir, monkeypatch):
+    def test_refresh_handles_command_failure_gracefully(self, temp_dir, write_config, monkeypatch):
         """Refresh shows error message if command fails."""
         monkeypatch.chdir(temp_dir)
 
@@ -388,9 +395,7 @@ Manual content here
                 ]
             }
         }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(config)
 
         agenda_content = """# Agenda
 
@@ -404,7 +409,7 @@ Manual content here
         updated_content = (temp_dir / "AGENDA.md").read_text()
         assert "[Error running command]" in updated_content or "Command failed" in updated_content
 
-    def test_refresh_skip_sections_skips_command(self, temp_dir, monkeypatch):
+    def test_refresh_skip_sections_skips_command(self, temp_dir, write_config, monkeypatch):
         """Refresh with skip_sections skips running the command for that section."""
         monkeypatch.chdir(temp_dir)
 
@@ -416,9 +421,7 @@ Manual content here
                 ]
             }
         }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(config)
 
         agenda_content = """# Agenda
 
@@ -439,7 +442,7 @@ old reminders content
         assert "old reminders content" in updated_content
         assert "new reminders" not in updated_content
 
-    def test_refresh_skip_sections_case_insensitive(self, temp_dir, monkeypatch):
+    def test_refresh_skip_sections_case_insensitive(self, temp_dir, write_config, monkeypatch):
         """Refresh skip_sections matching is case-insensitive."""
         monkeypatch.chdir(temp_dir)
 
@@ -450,9 +453,7 @@ old reminders content
                 ]
             }
         }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(config)
 
         agenda_content = """# Agenda
 
@@ -467,7 +468,7 @@ original content
         assert "original content" in updated_content
         assert "updated" not in updated_content
 
-    def test_refresh_skip_sections_empty_list_skips_nothing(self, temp_dir, monkeypatch):
+    def test_refresh_skip_sections_empty_list_skips_nothing(self, temp_dir, write_config, monkeypatch):
         """Refresh with empty skip_sections list refreshes everything."""
         monkeypatch.chdir(temp_dir)
 
@@ -478,9 +479,7 @@ original content
                 ]
             }
         }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(config)
 
         agenda_content = """# Agenda
 
@@ -494,7 +493,7 @@ old time
         updated_content = (temp_dir / "AGENDA.md").read_text()
         assert "current time" in updated_content
 
-    def test_refresh_skip_multiple_sections(self, temp_dir, monkeypatch):
+    def test_refresh_skip_multiple_sections(self, temp_dir, write_config, monkeypatch):
         """Refresh can skip multiple sections at once."""
         monkeypatch.chdir(temp_dir)
 
@@ -507,9 +506,7 @@ old time
                 ]
             }
         }
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file, "w") as f:
-            yaml.dump(config, f)
+        write_config(config)
 
         agenda_content = """# Agenda
 
@@ -534,14 +531,183 @@ old rem
         assert "prs" in updated_content
 
 
+class TestReplaceSectionContent:
+    """Test _replace_section_content splicing."""
+
+    def test_keeps_backslashes_in_output(self):
+        """Command output is inserted literally, not as a regex template."""
+        from cli.agenda import _replace_section_content
+
+        result = _replace_section_content(
+            "## Paths\n[Run: x]\n", {"name": "Paths"}, r"C:\new\d"
+        )
+
+        assert result == "## Paths\nC:\\new\\d\n"
+
+    def test_ignores_header_text_inside_deeper_headings(self):
+        """'### Notes' is not mistaken for the '## Notes' section."""
+        from cli.agenda import _replace_section_content
+
+        content = "## Tracked Items\n### Notes\nkeep\n## Other\n"
+
+        assert _replace_section_content(content, {"name": "Notes"}, "OUT") == content
+
+    def test_empty_section_does_not_swallow_next_section(self):
+        """An empty section body stops at the very next h2 header."""
+        from cli.agenda import _replace_section_content
+
+        result = _replace_section_content(
+            "## Date\n## Notes\nkeep\n", {"name": "Date"}, "Monday"
+        )
+
+        assert result == "## Date\nMonday\n## Notes\nkeep\n"
+
+
+class TestCommandCache:
+    """Test opt-in caching of section command output."""
+
+    def test_reuses_output_within_cache_ttl(self, temp_dir, monkeypatch):
+        """A section with cache_ttl reuses output from the previous run."""
+        from cli.agenda import _run_section_command
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir / "cache"))
+        section = {"name": "Value", "command": "cat value.txt", "cache_ttl": 300}
+
+        (temp_dir / "value.txt").write_text("first")
+        assert _run_section_command(section, temp_dir) == "first"
+
+        (temp_dir / "value.txt").write_text("second")
+        assert _run_section_command(section, temp_dir) == "first"
+
+    def test_runs_every_time_without_cache_ttl(self, temp_dir, monkeypatch):
+        """Sections without cache_ttl always run their command."""
+        from cli.agenda import _run_section_command
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir / "cache"))
+        section = {"name": "Value", "command": "cat value.txt"}
+
+        (temp_dir / "value.txt").write_text("first")
+        _run_section_command(section, temp_dir)
+        (temp_dir / "value.txt").write_text("second")
+
+        assert _run_section_command(section, temp_dir) == "second"
+        assert not (temp_dir / "cache").exists()
+
+    def test_does_not_cache_failures(self, temp_dir, monkeypatch):
+        """Failed commands are retried on the next run."""
+        from cli.agenda import _run_section_command
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir / "cache"))
+        section = {"name": "Value", "command": "cat value.txt", "cache_ttl": 300}
+
+        assert _run_section_command(section, temp_dir).startswith("[Error")
+
+        (temp_dir / "value.txt").write_text("ready")
+        assert _run_section_command(section, temp_dir) == "ready"
+
+
+class TestCommandTimeout:
+    """Test section command timeouts."""
+
+    def test_reports_timeout_for_slow_command(self, temp_dir):
+        """A command exceeding the section timeout is reported, not awaited."""
+        from cli.agenda import _run_section_command
+
+        section = {"name": "Slow", "command": "sleep 5", "timeout": 0.2}
+
+        assert _run_section_command(section, temp_dir) == "[Error running command: Timeout]"
+
+
+    def test_commands_without_timeout_are_not_limited(self, temp_dir, monkeypatch):
+        """Sections that don't set 'timeout' run without a time limit."""
+        from cli import agenda
+
+        mock_run = Mock(return_value=Mock(returncode=0, stdout="done\n", stderr=""))
+        monkeypatch.setattr(agenda.subprocess, "run", mock_run)
+
+        section = {"name": "Slow", "command": "slow-report"}
+
+        assert agenda._run_section_command(section, temp_dir) == "done"
+        assert mock_run.call_args.kwargs["timeout"] is None
+
+
+class TestSimpleCommandArgv:
+    """Test _simple_command_argv shell-free fast path detection."""
+
+    def test_splits_plain_command(self):
+        """Plain commands are split into argv with quotes removed."""
+        from cli.agenda import _simple_command_argv
+
+        assert _simple_command_argv("echo 'No meetings'") == ("echo", "No meetings")
+
+    def test_returns_none_for_shell_syntax(self):
+        """Commands using pipes, expansions or separators need the shell."""
+        from cli.agenda import _simple_command_argv
+
+        assert _simple_command_argv("ls | wc -l") is None
+        assert _simple_command_argv("echo $HOME") is None
+        assert _simple_command_argv("sleep 1; echo done") is None
+        assert _simple_command_argv("FOO=bar env") is None
+
+    def test_returns_none_for_unbalanced_quotes(self):
+        """Unparseable commands are left to the shell."""
+        from cli.agenda import _simple_command_argv
+
+        assert _simple_command_argv("echo 'oops") is None
+
+    def test_unknown_command_falls_back_to_shell_error(self, temp_dir):
+        """A missing executable is reported the same way as before."""
+        from cli.agenda import _run_section_command
+
+        output = _run_section_command(
+            {"name": "Broken", "command": "gameplan-no-such-command"}, temp_dir
+        )
+
+        assert output.startswith("[Error running command: Command failed]")
+        assert "not found" in output
+
+
+class TestLoadAgendaConfig:
+    """Test _load_agenda_config memoization."""
+
+    def test_reuses_parsed_config_while_file_unchanged(self, temp_dir):
+        """Returns the cached config when gameplan.yaml has not changed."""
+        from cli.agenda import _load_agenda_config
+
+        (temp_dir / "gameplan.yaml").write_text("agenda:\n  sections: []\n")
+
+        first = _load_agenda_config(temp_dir)
+        second = _load_agenda_config(temp_dir)
+
+        assert second is first
+
+    def test_reparses_config_when_file_changes(self, temp_dir):
+        """Reloads gameplan.yaml after it is modified."""
+        import os
+
+        from cli.agenda import _load_agenda_config
+
+        config_file = temp_dir / "gameplan.yaml"
+        config_file.write_text("agenda:\n  sections: []\n")
+        _load_agenda_config(temp_dir)
+
+        config_file.write_text("areas: {}\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        assert _load_agenda_config(temp_dir) == {"areas": {}}
+        with pytest.raises(ValueError, match="No 'agenda' section"):
+            _load_agenda_config(temp_dir, require_agenda=True)
+
+
 class TestFormatTrackedItems:
     """Test format_tracked_items function."""
 
-    def test_format_tracked_items_returns_message_if_no_config(self, temp_dir):
+    def test_format_tracked_items_returns_message_if_no_config(self, empty_dir):
         """format_tracked_items returns message if gameplan.yaml missing."""
         from cli.agenda import format_tracked_items
 
-        result = format_tracked_items(temp_dir)
+        result = format_tracked_items(empty_dir)
 
         assert result == "_No gameplan.yaml found_"
 
@@ -560,19 +726,12 @@ areas:
 
         assert result == "_No tracked items_"
 
-    def test_format_tracked_items_reads_from_tracking_files(self, temp_dir):
+    def test_format_tracked_items_reads_from_tracking_files(self, temp_dir, write_config):
         """format_tracked_items reads status from tracking README files."""
         from cli.agenda import format_tracked_items
 
         # Create config
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""
-areas:
-  jira:
-    items:
-      - issue: PROJ-123
-        env: prod
-""")
+        write_config(SINGLE_JIRA_ITEM_CONFIG)
 
         # Create tracking file with frontmatter
         tracking_dir = temp_dir / "tracking/areas/jira/PROJ-123-test-issue"
@@ -593,19 +752,12 @@ assignee: testuser
         assert "**Status:** In Progress" in result
         assert "Details →" in result
 
-    def test_format_tracked_items_uses_slim_format(self, temp_dir):
+    def test_format_tracked_items_uses_slim_format(self, temp_dir, write_config):
         """format_tracked_items outputs slim format with links to README."""
         from cli.agenda import format_tracked_items
 
         # Create config
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""
-areas:
-  jira:
-    items:
-      - issue: PROJ-123
-        env: prod
-""")
+        write_config(SINGLE_JIRA_ITEM_CONFIG)
 
         # Create tracking file with frontmatter
         tracking_dir = temp_dir / "tracking/areas/jira/PROJ-123-test-issue"
@@ -629,13 +781,12 @@ assignee: testuser
         # Should have link to README
         assert "tracking/areas/jira/PROJ-123-test-issue/README.md" in result
 
-    def test_format_tracked_items_handles_multiple_statuses(self, temp_dir):
+    def test_format_tracked_items_handles_multiple_statuses(self, temp_dir, write_config):
         """format_tracked_items shows correct status for each item."""
         from cli.agenda import format_tracked_items
 
         # Create config with multiple items
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""
+        write_config("""
 areas:
   jira:
     items:
@@ -646,7 +797,10 @@ areas:
       - issue: PROJ-5
 """)
 
-        # Create tracking files with frontmatter and different statuses
+        # Create tracking files with frontmatter and different statuses.
+        # The shared parent is created once; each issue needs only its leaf.
+        jira_dir = temp_dir / "tracking/areas/jira"
+        jira_dir.mkdir(parents=True)
         for issue_num, status in [
             ("1", "In Progress"),
             ("2", "Refinement"),
@@ -654,8 +808,8 @@ areas:
             ("4", "Done"),
             ("5", "Blocked"),
         ]:
-            tracking_dir = temp_dir / f"tracking/areas/jira/PROJ-{issue_num}-issue"
-            tracking_dir.mkdir(parents=True)
+            tracking_dir = jira_dir / f"PROJ-{issue_num}-issue"
+            tracking_dir.mkdir()
             readme = tracking_dir / "README.md"
             readme.write_text(f"""---
 issue_key: PROJ-{issue_num}
@@ -672,12 +826,15 @@ status: {status}
         assert "To Do" in result
         assert "Done" in result
         assert "Blocked" in result
+        # Items stay in config order
+        keys = re.findall(r"^### \[(PROJ-\d+)\]", result, re.MULTILINE)
+        assert keys == ["PROJ-1", "PROJ-2", "PROJ-3", "PROJ-4", "PROJ-5"]
 
 
 class TestExtractTrackedItemSubsections:
     """Test _extract_tracked_item_subsections helper."""
 
-    def test_extract_subsections_from_agenda(self, temp_dir):
+    def test_extract_subsections_from_agenda(self):
         """_extract_tracked_item_subsections extracts Actions and Notes."""
         from cli.agenda import _extract_tracked_item_subsections
 
@@ -740,6 +897,29 @@ Some content but no subsections
         assert result["PROJ-123"]["actions"] == ""
         assert result["PROJ-123"]["notes"] == ""
 
+    def test_extract_subsections_stops_at_other_subheadings(self):
+        """Actions end at any other h4 without keeping part of its heading."""
+        from cli.agenda import _extract_tracked_item_subsections
+
+        content = """### [PROJ-123] Test
+
+#### Actions
+
+- [ ] Task 1
+
+#### Links
+
+- ignored
+
+#### Notes
+
+Notes here
+"""
+
+        result = _extract_tracked_item_subsections(content)
+
+        assert result["PROJ-123"] == {"actions": "- [ ] Task 1", "notes": "Notes here"}
+
 
 class TestReadJiraStatus:
     """Test _read_jira_status helper."""
@@ -763,6 +943,23 @@ class TestReadJiraStatus:
         assert result["title"] == "Test Issue"
         assert result["assignee"] == "John Doe"
 
+    def test_read_jira_status_with_missing_fields(self, temp_dir):
+        """_read_jira_status fills defaults for fields the README lacks."""
+        from cli.agenda import _read_jira_status
+
+        tracking_dir = temp_dir / "tracking/areas/jira/PROJ-123-test-issue"
+        tracking_dir.mkdir(parents=True)
+        (tracking_dir / "README.md").write_text("""Intro text
+
+- **Status**: Blocked
+
+# PROJ-123: Late Title
+""")
+
+        result = _read_jira_status(temp_dir, "PROJ-123")
+
+        assert result == {"status": "Blocked", "title": "Late Title", "assignee": ""}
+
     def test_read_jira_status_returns_unknown_if_not_found(self, temp_dir):
         """_read_jira_status returns Unknown if tracking file not found."""
         from cli.agenda import _read_jira_status
@@ -995,6 +1192,30 @@ class TestExtractIssueKeyFromTitle:
         assert result is None
 
 
+class TestTodayStrings:
+    """Test _today_strings helper."""
+
+    def test_formats_date_for_headers(self):
+        """Returns long, ISO and weekday forms of the date."""
+        from datetime import date
+
+        from cli.agenda import _today_strings
+
+        result = _today_strings(date(2026, 1, 5))
+
+        assert result == ("Monday, January 05, 2026", "2026-01-05", "Monday")
+
+    def test_reformats_when_date_changes(self):
+        """A new day is formatted rather than served from the cache."""
+        from datetime import date
+
+        from cli.agenda import _today_strings
+
+        _today_strings(date(2026, 1, 5))
+
+        assert _today_strings(date(2026, 1, 6))[2] == "Tuesday"
+
+
 class TestGetWeekStart:
     """Test _get_week_start helper."""
 
@@ -1152,6 +1373,127 @@ class TestAppendToLogbook:
         assert logged == 0
         assert initiatives == 0
 
+    def test_does_not_rewrite_logbook_if_all_duplicates(self, temp_dir):
+        """Leaves LOGBOOK.md untouched when every task is already logged."""
+        logbook = temp_dir / "LOGBOOK.md"
+        original = """# Logbook
+
+## Week of 2025-10-13
+
+### PROJ-123 (Test)
+
+- [x] Existing task ✅ 2025-10-13
+"""
+        logbook.write_text(original)
+
+        completed_tasks = {
+            "[PROJ-123] Test": {
+                "2025-10-13": ["- [x] Existing task ✅ 2025-10-13"]
+            }
+        }
+
+        logged, _ = append_to_logbook(completed_tasks, temp_dir)
+
+        assert logged == 0
+        assert logbook.read_text() == original
+
+    def test_does_not_create_logbook_if_no_tasks(self, temp_dir):
+        """Does not create LOGBOOK.md when there is nothing to log."""
+        append_to_logbook({}, temp_dir)
+
+        assert not (temp_dir / "LOGBOOK.md").exists()
+
+
+class TestAtomicWriteText:
+    """Test _atomic_write_text helper."""
+
+    def test_replaces_file_and_leaves_no_temp_file(self, temp_dir):
+        """Writes new content in place without leaving the temp file behind."""
+        from cli.agenda import _atomic_write_text
+
+        target = temp_dir / "LOGBOOK.md"
+        target.write_text("old")
+
+        _atomic_write_text(target, "new")
+
+        assert target.read_text() == "new"
+        assert sorted(p.name for p in temp_dir.iterdir()) == ["LOGBOOK.md"]
+
+    def test_writes_through_symlink_and_keeps_mode(self, temp_dir):
+        """Updates a symlink's target in place and preserves its permissions."""
+        import os
+        import stat
+
+        from cli.agenda import _atomic_write_text
+
+        target = temp_dir / "real.md"
+        target.write_text("old")
+        target.chmod(0o600)
+        link = temp_dir / "AGENDA.md"
+        link.symlink_to(target)
+
+        _atomic_write_text(link, "new")
+
+        assert link.is_symlink()
+        assert target.read_text() == "new"
+        assert stat.S_IMODE(os.stat(target).st_mode) == 0o600
+
+
+class TestLogbookCache:
+    """Test the LOGBOOK.md parse cache."""
+
+    def test_append_writes_cache_matching_logbook(self, temp_dir):
+        """Appending tasks stores the parsed entries for the new content."""
+        from cli.agenda import _load_logbook_entries, _parse_logbook
+
+        completed_tasks = {
+            "[PROJ-123] Test": {
+                "2025-10-13": ["- [x] Task ✅ 2025-10-13"]
+            }
+        }
+        append_to_logbook(completed_tasks, temp_dir)
+
+        content = (temp_dir / "LOGBOOK.md").read_text()
+        assert cache_file_for("logbook", temp_dir / "LOGBOOK.md").exists()
+        # Nothing besides the logbook is written into the gameplan repository
+        assert [p.name for p in temp_dir.iterdir()] == ["LOGBOOK.md"]
+        assert _load_logbook_entries(temp_dir, content) == _parse_logbook(content)
+
+    def test_edited_logbook_invalidates_cache(self, temp_dir):
+        """A hand-edited LOGBOOK.md is parsed again instead of using the cache."""
+        completed_tasks = {
+            "[PROJ-123] Test": {
+                "2025-10-13": ["- [x] First ✅ 2025-10-13"]
+            }
+        }
+        append_to_logbook(completed_tasks, temp_dir)
+
+        logbook = temp_dir / "LOGBOOK.md"
+        logbook.write_text(logbook.read_text() + "- [x] Added by hand ✅ 2025-10-14\n")
+
+        append_to_logbook({
+            "[PROJ-123] Test": {
+                "2025-10-15": ["- [x] Second ✅ 2025-10-15"]
+            }
+        }, temp_dir)
+
+        content = logbook.read_text()
+        assert "- [x] Added by hand ✅ 2025-10-14" in content
+        assert "- [x] Second ✅ 2025-10-15" in content
+
+    def test_ignores_corrupt_cache(self, temp_dir):
+        """An unreadable cache falls back to parsing LOGBOOK.md."""
+        from cli.agenda import _load_logbook_entries
+
+        cache_file = cache_file_for("logbook", temp_dir / "LOGBOOK.md")
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text("not json")
+        content = "# Logbook\n\n## Week of 2025-10-13\n\n### Other\n\n- [x] Task ✅ 2025-10-13\n"
+
+        entries = _load_logbook_entries(temp_dir, content)
+
+        assert entries == {"2025-10-13": {"Other": ["- [x] Task ✅ 2025-10-13"]}}
+
 
 class TestParseLogbook:
     """Test _parse_logbook helper."""
@@ -1203,10 +1545,15 @@ class TestBuildLogbookContent:
 
         result = _build_logbook_content(entries)
 
-        # Newest week first
-        assert result.index("Week of 2025-10-13") < result.index("Week of 2025-10-06")
-        # Other comes after tracked items
-        assert result.index("### PROJ-123") < result.index("### Other")
+        # Newest week first, and Other comes after tracked items
+        headings = [line for line in result.split("\n") if line.startswith("##")]
+        assert headings == [
+            "## Week of 2025-10-13",
+            "### PROJ-123 (Test)",
+            "### Other",
+            "## Week of 2025-10-06",
+            "### PROJ-456 (Another)",
+        ]
 
 
 class TestRemoveCompletedTasksFromContent:
@@ -1274,6 +1621,49 @@ Keep these notes
         result = remove_completed_tasks_from_content(content, {})
         assert result == content
 
+    def test_preserves_trailing_newline(self):
+        """Keeps the content's trailing newline after removing tasks."""
+        content = "## Notes\n\n- [x] Done ✅ 2025-10-13\n- [ ] Pending\n"
+        completed_tasks = {
+            "Other": {"2025-10-13": ["- [x] Done ✅ 2025-10-13"]}
+        }
+
+        result = remove_completed_tasks_from_content(content, completed_tasks)
+
+        assert result == "## Notes\n\n- [ ] Pending\n"
+
+
+class TestExtractAndStrip:
+    """Test _extract_and_strip single-pass helper."""
+
+    def test_matches_extract_then_remove(self):
+        """Returns the same result as extracting and then removing tasks."""
+        from cli.agenda import _extract_and_strip
+
+        content = """# Agenda
+
+## 🔄 Tracked Items
+
+### [PROJ-123] Test
+
+#### Actions
+
+- [x] Task 1 ✅ 2025-10-13
+- [ ] Pending
+- [x] No date
+
+## Notes
+
+- [x] Misc ✅ 2025-10-14
+"""
+        expected_tasks = extract_completed_tasks(content)
+
+        completed_tasks, stripped = _extract_and_strip(content)
+
+        assert completed_tasks == expected_tasks
+        assert stripped == remove_completed_tasks_from_content(content, expected_tasks)
+        assert "- [x] No date" in stripped
+
 
 class TestProcessLogbook:
     """Test process_logbook integration function."""
@@ -1350,7 +1740,7 @@ Notes here
 class TestRefreshAgendaWithLogbook:
     """Test that refresh_agenda integrates logbook processing."""
 
-    def test_refresh_processes_logbook(self, temp_dir, monkeypatch):
+    def test_refresh_processes_logbook(self, temp_dir, write_config, monkeypatch):
         """Refresh processes completed tasks into logbook."""
         monkeypatch.chdir(temp_dir)
 
@@ -1362,7 +1752,7 @@ class TestRefreshAgendaWithLogbook:
                 ]
             }
         }
-        (temp_dir / "gameplan.yaml").write_text(yaml.dump(config))
+        write_config(config)
 
         # Create AGENDA.md with completed task
         (temp_dir / "AGENDA.md").write_text("""# Agenda - Monday, October 13, 2025
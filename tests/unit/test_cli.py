@@ -4,254 +4,185 @@ These are smoke tests to ensure the CLI structure is correct and
 commands are properly wired up.
 """
 
-import subprocess
+import argparse
+import shutil
 import sys
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from typing import Any, Dict, Tuple
+from unittest.mock import MagicMock
 
 import pytest
 
-from cli.cli import main
+from cli.agenda import init_agenda
+from cli.cli import build_parser, main
+from cli.init import init_gameplan
 
 
-class TestCLIStructure:
-    """Test basic CLI structure and help text."""
+def _subcommands(parser: argparse.ArgumentParser) -> Dict[str, argparse.ArgumentParser]:
+    """Return the subcommand parsers registered on parser, by name."""
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            return dict(action.choices)
+    return {}
 
-    def test_cli_shows_help_with_no_args(self):
-        """CLI shows help when run with no arguments."""
-        result = subprocess.run(
-            [sys.executable, "-m", "cli.cli"],
-            capture_output=True,
-            text=True,
-        )
 
-        assert "usage:" in result.stdout.lower() or "usage:" in result.stderr.lower()
+@pytest.fixture
+def run_cli(monkeypatch, capsys):
+    """Return a function that runs the gameplan CLI in-process.
 
-    def test_cli_has_init_command(self):
-        """CLI has 'init' command."""
-        result = subprocess.run(
-            [sys.executable, "-m", "cli.cli", "init", "--help"],
-            capture_output=True,
-            text=True,
-        )
+    The function takes the arguments that follow "gameplan" and returns
+    the exit code (0 if main() returns normally) and the captured output.
+    """
+    def _run(*args: str) -> Tuple[int, Any]:
+        monkeypatch.setattr(sys, "argv", ["gameplan", *args])
+        try:
+            main()
+            exit_code = 0
+        except SystemExit as e:
+            exit_code = e.code or 0
+        return exit_code, capsys.readouterr()
 
-        assert result.returncode == 0
-        output = result.stdout + result.stderr
-        assert "init" in output.lower()
+    return _run
 
-    def test_cli_has_agenda_command(self):
-        """CLI has 'agenda' command."""
-        result = subprocess.run(
-            [sys.executable, "-m", "cli.cli", "agenda", "--help"],
-            capture_output=True,
-            text=True,
-        )
 
-        assert result.returncode == 0
-        output = result.stdout + result.stderr
-        assert "agenda" in output.lower()
+@pytest.fixture(scope="module")
+def agenda_template(tmp_path_factory):
+    """Build an initialized gameplan with AGENDA.md once per module.
+
+    Tests copy it rather than running init and agenda init themselves.
+    """
+    template_dir = tmp_path_factory.mktemp("agenda-template")
+    init_gameplan(target_dir=template_dir, interactive=False)
+    init_agenda(base_path=template_dir)
+    return template_dir
+
+
+class TestCLIStructure:
+    """Test basic CLI structure and help text."""
+
+    def test_cli_parser_structure(self):
+        """CLI registers the top-level and nested subcommands."""
+        parser = build_parser()
+
+        commands = _subcommands(parser)
+        assert {"init", "agenda", "sync", "jira"} <= set(commands)
+        assert set(_subcommands(commands["agenda"])) == {
+            "init", "view", "refresh", "tracked-items",
+        }
+        assert set(_subcommands(commands["jira"])) == {"populate"}
 
 
 class TestInitCommand:
     """Test init command integration."""
 
-    def test_init_creates_gameplan_yaml(self, temp_dir):
+    def test_init_creates_gameplan_yaml(self, temp_dir, run_cli):
         """Running 'gameplan init' creates gameplan.yaml."""
-        result = subprocess.run(
-            [sys.executable, "-m", "cli.cli", "init", "-d", str(temp_dir)],
-            capture_output=True,
-            text=True,
-        )
+        exit_code, _ = run_cli("init", "-d", str(temp_dir))
 
-        assert result.returncode == 0
+        assert exit_code == 0
         assert (temp_dir / "gameplan.yaml").exists()
 
-    def test_init_shows_error_if_already_initialized(self, temp_dir):
+    def test_init_shows_error_if_already_initialized(self, temp_dir, run_cli):
         """Running 'gameplan init' twice shows error."""
         # First init
-        subprocess.run(
-            [sys.executable, "-m", "cli.cli", "init", "-d", str(temp_dir)],
-            capture_output=True,
-        )
+        run_cli("init", "-d", str(temp_dir))
 
         # Second init should fail
-        result = subprocess.run(
-            [sys.executable, "-m", "cli.cli", "init", "-d", str(temp_dir)],
-            capture_output=True,
-            text=True,
-        )
+        exit_code, captured = run_cli("init", "-d", str(temp_dir))
 
-        assert result.returncode != 0
-        output = result.stdout + result.stderr
-        assert "already exists" in output.lower()
+        assert exit_code != 0
+        assert "already exists" in (captured.out + captured.err).lower()
 
 
 class TestAgendaCommand:
     """Test agenda command integration."""
 
-    def test_agenda_init_creates_agenda_file(self, temp_dir):
+    @pytest.fixture(autouse=True)
+    def _in_temp_dir(self, temp_dir, monkeypatch):
+        """Run agenda commands from temp_dir, as the subprocess tests did."""
+        monkeypatch.delenv("GAMEPLAN_BASE_DIR", raising=False)
+        monkeypatch.chdir(temp_dir)
+
+    @pytest.fixture
+    def agenda_dir(self, agenda_template, temp_dir):
+        """Copy the initialized gameplan + agenda into this test's temp_dir."""
+        shutil.copytree(agenda_template, temp_dir, dirs_exist_ok=True)
+        return temp_dir
+
+    def test_agenda_init_creates_agenda_file(self, temp_dir, run_cli):
         """Running 'gameplan agenda init' creates AGENDA.md."""
         # First initialize gameplan
-        subprocess.run(
-            [sys.executable, "-m", "cli.cli", "init", "-d", str(temp_dir)],
-            capture_output=True,
-        )
+        run_cli("init", "-d", str(temp_dir))
 
         # Then create agenda
-        result = subprocess.run(
-            [sys.executable, "-m", "cli.cli", "agenda", "init"],
-            cwd=temp_dir,
-            capture_output=True,
-            text=True,
-        )
+        exit_code, _ = run_cli("agenda", "init")
 
-        assert result.returncode == 0
+        assert exit_code == 0
         assert (temp_dir / "AGENDA.md").exists()
 
-    def test_agenda_view_shows_content(self, temp_dir):
+    def test_agenda_view_shows_content(self, agenda_dir, run_cli):
         """Running 'gameplan agenda view' shows AGENDA.md content."""
-        # Setup
-        subprocess.run(
-            [sys.executable, "-m", "cli.cli", "init", "-d", str(temp_dir)],
-            capture_output=True,
-        )
-        subprocess.run(
-            [sys.executable, "-m", "cli.cli", "agenda", "init"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-
-        # View agenda
-        result = subprocess.run(
-            [sys.executable, "-m", "cli.cli", "agenda", "view"],
-            cwd=temp_dir,
-            capture_output=True,
-            text=True,
-        )
+        exit_code, captured = run_cli("agenda", "view")
 
-        assert result.returncode == 0
-        assert "# Agenda" in result.stdout
+        assert exit_code == 0
+        assert "# Agenda" in captured.out
 
-    def test_agenda_refresh_updates_sections(self, temp_dir):
+    def test_agenda_refresh_updates_sections(self, agenda_dir, run_cli):
         """Running 'gameplan agenda refresh' updates command sections."""
-        # Setup
-        subprocess.run(
-            [sys.executable, "-m", "cli.cli", "init", "-d", str(temp_dir)],
-            capture_output=True,
-        )
-        subprocess.run(
-            [sys.executable, "-m", "cli.cli", "agenda", "init"],
-            cwd=temp_dir,
-            capture_output=True,
-        )
-
-        # Refresh agenda
-        result = subprocess.run(
-            [sys.executable, "-m", "cli.cli", "agenda", "refresh"],
-            cwd=temp_dir,
-            capture_output=True,
-            text=True,
-        )
+        exit_code, captured = run_cli("agenda", "refresh")
 
-        assert result.returncode == 0
+        assert exit_code == 0
+        assert "Refreshed AGENDA.md" in captured.out
 
 
 class TestCLICommandRouting:
     """Test CLI command routing with direct function calls."""
 
-    @patch("cli.init.init_gameplan")
-    @patch("sys.argv", ["gameplan", "init"])
-    def test_init_command_calls_init_gameplan(self, mock_init):
-        """init command routes to init_gameplan function."""
-        mock_init.return_value = Path("/test")
+    @pytest.mark.parametrize(
+        "target, args",
+        [
+            ("cli.init.init_gameplan", ["init"]),
+            ("cli.sync.sync_all", ["sync"]),
+            ("cli.agenda.init_agenda", ["agenda", "init"]),
+            ("cli.agenda.view_agenda", ["agenda", "view"]),
+            ("cli.agenda.refresh_agenda", ["agenda", "refresh"]),
+            ("cli.sync.populate_jira_items", ["jira", "populate"]),
+        ],
+    )
+    def test_command_routes_to_function(self, monkeypatch, run_cli, target, args):
+        """Each command routes to its implementing function."""
+        mock_target = MagicMock()
+        monkeypatch.setattr(target, mock_target)
 
-        try:
-            main()
-        except SystemExit:
-            pass
+        run_cli(*args)
 
-        mock_init.assert_called_once()
+        mock_target.assert_called_once()
 
-    @patch("cli.init.init_gameplan")
-    @patch("sys.argv", ["gameplan", "init", "-d", "/tmp/test"])
-    def test_init_command_passes_directory_argument(self, mock_init):
+    def test_init_command_passes_directory_argument(self, monkeypatch, run_cli):
         """init command passes --directory argument."""
-        mock_init.return_value = Path("/tmp/test")
+        mock_init = MagicMock(return_value=Path("/tmp/test"))
+        monkeypatch.setattr("cli.init.init_gameplan", mock_init)
 
-        try:
-            main()
-        except SystemExit:
-            pass
+        run_cli("init", "-d", "/tmp/test")
 
         # Check that target_dir was passed
         assert mock_init.call_count == 1
         assert mock_init.call_args[1]["target_dir"] == Path("/tmp/test")
 
-    @patch("cli.sync.sync_all")
-    @patch("sys.argv", ["gameplan", "sync"])
-    def test_sync_command_calls_sync_all(self, mock_sync):
-        """sync command routes to sync_all function."""
-        try:
-            main()
-        except SystemExit:
-            pass
-
-        mock_sync.assert_called_once()
-
-    @patch("cli.agenda.init_agenda")
-    @patch("sys.argv", ["gameplan", "agenda", "init"])
-    def test_agenda_init_calls_init_agenda(self, mock_init):
-        """agenda init routes to init_agenda function."""
-        try:
-            main()
-        except SystemExit:
-            pass
-
-        mock_init.assert_called_once()
-
-    @patch("cli.agenda.view_agenda")
-    @patch("sys.argv", ["gameplan", "agenda", "view"])
-    def test_agenda_view_calls_view_agenda(self, mock_view):
-        """agenda view routes to view_agenda function."""
-        mock_view.return_value = "# Agenda\n\nTest content"
-
-        try:
-            main()
-        except SystemExit:
-            pass
-
-        mock_view.assert_called_once()
-
-    @patch("cli.agenda.refresh_agenda")
-    @patch("sys.argv", ["gameplan", "agenda", "refresh"])
-    def test_agenda_refresh_calls_refresh_agenda(self, mock_refresh):
-        """agenda refresh routes to refresh_agenda function."""
-        try:
-            main()
-        except SystemExit:
-            pass
-
-        mock_refresh.assert_called_once()
-
-    @patch("sys.argv", ["gameplan"])
-    def test_no_command_shows_help(self, capsys):
+    def test_no_command_shows_help(self, run_cli):
         """Running gameplan with no command shows help."""
-        with pytest.raises(SystemExit):
-            main()
+        exit_code, captured = run_cli()
 
+        assert exit_code != 0
         # argparse writes help to stderr by default
-        captured = capsys.readouterr()
         output = captured.out + captured.err
         assert "usage:" in output.lower()
 
-    @patch("sys.argv", ["gameplan", "--help"])
-    def test_help_flag_shows_help(self, capsys):
+    def test_help_flag_shows_help(self, run_cli):
         """--help flag shows help text."""
-        with pytest.raises(SystemExit) as exc_info:
-            main()
+        exit_code, captured = run_cli("--help")
 
-        assert exc_info.value.code == 0
-        captured = capsys.readouterr()
+        assert exit_code == 0
         output = captured.out + captured.err
         assert "usage:" in output.lower()
 
@@ -259,52 +190,24 @@ class TestCLICommandRouting:
 class TestJiraPopulateCommand:
     """Test 'gameplan jira populate' CLI command."""
 
-    def test_cli_has_jira_command(self):
-        """CLI has 'jira' command."""
-        result = subprocess.run(
-            [sys.executable, "-m", "cli.cli", "jira", "--help"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0
-        output = result.stdout + result.stderr
-        assert "populate" in output.lower()
-
-    def test_cli_jira_populate_has_help(self):
-        """CLI 'jira populate' has help text."""
-        result = subprocess.run(
-            [sys.executable, "-m", "cli.cli", "jira", "populate", "--help"],
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0
-        output = result.stdout + result.stderr
-        assert "--jql" in output
-        assert "--env" in output
+    def test_cli_jira_populate_has_options(self):
+        """CLI 'jira populate' accepts --jql and --env."""
+        jira_parser = _subcommands(build_parser())["jira"]
+        populate_parser = _subcommands(jira_parser)["populate"]
 
-    @patch("cli.sync.populate_jira_items")
-    @patch("sys.argv", ["gameplan", "jira", "populate"])
-    def test_jira_populate_calls_populate_function(self, mock_populate):
-        """jira populate routes to populate_jira_items."""
-        try:
-            main()
-        except SystemExit:
-            pass
-
-        mock_populate.assert_called_once()
+        options = {
+            option
+            for action in populate_parser._actions
+            for option in action.option_strings
+        }
+        assert {"--jql", "--env"} <= options
 
-    @patch("cli.sync.populate_jira_items")
-    @patch(
-        "sys.argv", ["gameplan", "jira", "populate", "--jql", "project = TEST", "--env", "staging"]
-    )
-    def test_jira_populate_passes_jql_and_env_overrides(self, mock_populate):
+    def test_jira_populate_passes_jql_and_env_overrides(self, monkeypatch, run_cli):
         """jira populate passes --jql and --env args to populate function."""
-        try:
-            main()
-        except SystemExit:
-            pass
+        mock_populate = MagicMock()
+        monkeypatch.setattr("cli.sync.populate_jira_items", mock_populate)
+
+        run_cli("jira", "populate", "--jql", "project = TEST", "--env", "staging")
 
         mock_populate.assert_called_once()
         call_kwargs = mock_populate.call_args
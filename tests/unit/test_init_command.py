@@ -10,73 +10,80 @@ import yaml
 
 from cli.init import init_gameplan
 
+# libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@pytest.fixture(scope="module")
+def initialized_dir(tmp_path_factory):
+    """Run init_gameplan once per module and return (path, parsed config).
+
+    Shared by the tests that only inspect what init wrote; tests that
+    init again or need a different target use temp_dir instead.
+    """
+    target_dir = tmp_path_factory.mktemp("init")
+    init_gameplan(target_dir=target_dir, interactive=False)
+
+    with open(target_dir / "gameplan.yaml") as f:
+        config = yaml.load(f, Loader=YAML_LOADER)
+
+    return target_dir, config
+
 
 class TestInitGameplan:
     """Test the init_gameplan function."""
 
-    def test_init_creates_tracking_directory(self, temp_dir):
+    def test_init_creates_tracking_directory(self, initialized_dir):
         """Init creates tracking/areas/ directory structure."""
-        init_gameplan(target_dir=temp_dir, interactive=False)
+        target_dir, _ = initialized_dir
 
-        tracking_dir = temp_dir / "tracking" / "areas"
+        tracking_dir = target_dir / "tracking" / "areas"
         assert tracking_dir.exists()
         assert tracking_dir.is_dir()
 
-    def test_init_creates_jira_area_directory(self, temp_dir):
+    def test_init_creates_jira_area_directory(self, initialized_dir):
         """Init creates tracking/areas/jira/ directory."""
-        init_gameplan(target_dir=temp_dir, interactive=False)
+        target_dir, _ = initialized_dir
 
-        jira_dir = temp_dir / "tracking" / "areas" / "jira"
+        jira_dir = target_dir / "tracking" / "areas" / "jira"
         assert jira_dir.exists()
         assert jira_dir.is_dir()
 
-    def test_init_creates_jira_archive_directory(self, temp_dir):
+    def test_init_creates_jira_archive_directory(self, initialized_dir):
         """Init creates tracking/areas/jira/archive/ directory."""
-        init_gameplan(target_dir=temp_dir, interactive=False)
+        target_dir, _ = initialized_dir
 
-        archive_dir = temp_dir / "tracking" / "areas" / "jira" / "archive"
+        archive_dir = target_dir / "tracking" / "areas" / "jira" / "archive"
         assert archive_dir.exists()
         assert archive_dir.is_dir()
 
-    def test_init_creates_gameplan_yaml(self, temp_dir):
+    def test_init_creates_gameplan_yaml(self, initialized_dir):
         """Init creates gameplan.yaml configuration file."""
-        init_gameplan(target_dir=temp_dir, interactive=False)
+        target_dir, _ = initialized_dir
 
-        config_file = temp_dir / "gameplan.yaml"
+        config_file = target_dir / "gameplan.yaml"
         assert config_file.exists()
         assert config_file.is_file()
 
-    def test_init_gameplan_yaml_has_valid_structure(self, temp_dir):
+    def test_init_gameplan_yaml_has_valid_structure(self, initialized_dir):
         """Init creates gameplan.yaml with valid YAML structure."""
-        init_gameplan(target_dir=temp_dir, interactive=False)
-
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file) as f:
-            config = yaml.safe_load(f)
+        _, config = initialized_dir
 
         assert isinstance(config, dict)
         assert "areas" in config
         assert isinstance(config["areas"], dict)
 
-    def test_init_gameplan_yaml_has_jira_section(self, temp_dir):
+    def test_init_gameplan_yaml_has_jira_section(self, initialized_dir):
         """Init creates gameplan.yaml with jira area configuration."""
-        init_gameplan(target_dir=temp_dir, interactive=False)
-
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file) as f:
-            config = yaml.safe_load(f)
+        _, config = initialized_dir
 
         assert "jira" in config["areas"]
         assert "items" in config["areas"]["jira"]
         assert isinstance(config["areas"]["jira"]["items"], list)
 
-    def test_init_gameplan_yaml_starts_with_empty_items(self, temp_dir):
+    def test_init_gameplan_yaml_starts_with_empty_items(self, initialized_dir):
         """Init creates gameplan.yaml with empty items list."""
-        init_gameplan(target_dir=temp_dir, interactive=False)
-
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file) as f:
-            config = yaml.safe_load(f)
+        _, config = initialized_dir
 
         assert config["areas"]["jira"]["items"] == []
 
@@ -114,25 +121,17 @@ class TestInitGameplan:
         assert isinstance(result, Path)
         assert result == temp_dir
 
-    def test_init_gameplan_yaml_has_agenda_section(self, temp_dir):
+    def test_init_gameplan_yaml_has_agenda_section(self, initialized_dir):
         """Init creates gameplan.yaml with agenda configuration."""
-        init_gameplan(target_dir=temp_dir, interactive=False)
-
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file) as f:
-            config = yaml.safe_load(f)
+        _, config = initialized_dir
 
         assert "agenda" in config
         assert "sections" in config["agenda"]
         assert isinstance(config["agenda"]["sections"], list)
 
-    def test_init_gameplan_yaml_has_default_agenda_sections(self, temp_dir):
+    def test_init_gameplan_yaml_has_default_agenda_sections(self, initialized_dir):
         """Init creates gameplan.yaml with default agenda sections."""
-        init_gameplan(target_dir=temp_dir, interactive=False)
-
-        config_file = temp_dir / "gameplan.yaml"
-        with open(config_file) as f:
-            config = yaml.safe_load(f)
+        _, config = initialized_dir
 
         sections = config["agenda"]["sections"]
         assert len(sections) > 0
@@ -1,13 +1,14 @@
 """Tests for sync command."""
 
-import json
-from pathlib import Path
-from unittest.mock import MagicMock, patch, mock_open
+import os
+import threading
+from typing import Any, Dict
+from unittest.mock import Mock, patch
 
 import pytest
-import yaml
 
 from cli.adapters.base import TrackedItem, ItemData
+from cli.adapters.jira import JiraAdapter
 from cli.sync import (
     DEFAULT_POPULATE_JQL,
     load_config,
@@ -18,81 +19,226 @@ from cli.sync import (
 )
 
 
+def _manual(key: str) -> Dict[str, str]:
+    """Config entry for a manually tracked issue."""
+    return {"issue": key, "env": "prod"}
+
+
+def _populated(key: str) -> Dict[str, str]:
+    """Config entry added by a previous populate run."""
+    return {"issue": key, "env": "prod", "source": "populate"}
+
+
+# (initial items, search result keys, expected items after populate)
+POPULATE_CASES = [
+    pytest.param(
+        [_populated("OLD-1"), _populated("OLD-2")],
+        ["NEW-1"],
+        [_populated("NEW-1")],
+        id="removes-stale-populate-items",
+    ),
+    pytest.param(
+        [_manual("MANUAL-1"), _populated("STALE-POPULATE")],
+        ["NEW-1"],
+        [_manual("MANUAL-1"), _populated("NEW-1")],
+        id="preserves-manual-items",
+    ),
+    pytest.param(
+        [_populated("PROJ-123")],
+        ["PROJ-123", "PROJ-456"],
+        [_populated("PROJ-123"), _populated("PROJ-456")],
+        id="does-not-duplicate-populate-items",
+    ),
+    pytest.param(
+        [_manual("MANUAL-1")],
+        ["MANUAL-1", "NEW-1"],
+        [_manual("MANUAL-1"), _populated("NEW-1")],
+        id="does-not-tag-manual-item-matching-search",
+    ),
+    pytest.param(
+        [_manual("MANUAL-1"), _populated("POP-1")],
+        [],
+        [_manual("MANUAL-1")],
+        id="empty-results-removes-only-populate-items",
+    ),
+]
+
+
+@pytest.fixture
+def mock_adapter_class(monkeypatch):
+    """Replace cli.sync.JiraAdapter with a Mock class.
+
+    The class returns the same JiraAdapter-specced Mock on every call, so
+    tests configure mock_adapter_class.return_value before running sync.
+    """
+    adapter_class = Mock(return_value=Mock(spec=JiraAdapter))
+    # Bulk search finds nothing by default, so issues go through fetch_item_data
+    adapter_class.return_value.fetch_items_bulk.return_value = {}
+    monkeypatch.setattr("cli.sync.JiraAdapter", adapter_class)
+    return adapter_class
+
+
+# gameplan.yaml contents shared by the sync_jira tests; write_config dumps
+# them without modifying them
+SINGLE_ITEM_CONFIG = {"areas": {"jira": {"items": [_manual("PROJ-123")]}}}
+TWO_ITEM_CONFIG = {"areas": {"jira": {"items": [_manual("PROJ-123"), _manual("PROJ-456")]}}}
+
+
+COMPLEX_CONFIG_YAML = """
+areas:
+  jira:
+    items:
+      - issue: PROJ-123
+        env: prod
+agenda:
+  sections:
+    - name: Focus
+      emoji: 🎯
+"""
+
+
+@pytest.fixture(scope="module")
+def complex_config_dir(tmp_path_factory):
+    """Directory with COMPLEX_CONFIG_YAML as gameplan.yaml, shared by the module.
+
+    For tests that only load the config; tests must not modify it.
+    """
+    config_dir = tmp_path_factory.mktemp("complex-config")
+    (config_dir / "gameplan.yaml").write_bytes(COMPLEX_CONFIG_YAML.encode("utf-8"))
+    return config_dir
+
+
+@pytest.fixture
+def patch_config(monkeypatch):
+    """Return a function that makes cli.sync.load_config return a config.
+
+    For tests of sync control flow, which do not need gameplan.yaml on disk.
+    """
+    def _patch(config: Dict[str, Any]) -> None:
+        monkeypatch.setattr("cli.sync.load_config", lambda base_path: config)
+
+    return _patch
+
+
 class TestLoadConfig:
     """Tests for loading gameplan.yaml configuration."""
 
-    def test_load_config_reads_yaml_file(self, temp_dir):
+    def test_load_config_reads_yaml_file(self, complex_config_dir):
         """load_config reads and parses YAML file."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("areas:\n  jira:\n    items: []\n")
-
-        result = load_config(temp_dir)
+        result = load_config(complex_config_dir)
 
-        assert result == {"areas": {"jira": {"items": []}}}
+        assert result == {
+            "areas": {"jira": {"items": [{"issue": "PROJ-123", "env": "prod"}]}},
+            "agenda": {"sections": [{"name": "Focus", "emoji": "🎯"}]},
+        }
 
-    def test_load_config_returns_empty_dict_if_file_missing(self, temp_dir, capsys):
+    def test_load_config_returns_empty_dict_if_file_missing(self, empty_dir, capsys):
         """load_config returns empty dict if gameplan.yaml doesn't exist."""
-        result = load_config(temp_dir)
+        result = load_config(empty_dir)
 
         assert result == {}
         captured = capsys.readouterr()
         assert "Configuration not found" in captured.err
 
-    def test_load_config_handles_complex_yaml(self, temp_dir):
+    def test_load_config_handles_complex_yaml(self, complex_config_dir):
         """load_config parses complex YAML structures."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""
-areas:
-  jira:
-    items:
-      - issue: PROJ-123
-        env: prod
-agenda:
-  sections:
-    - name: Focus
-      emoji: 🎯
-""")
-
-        result = load_config(temp_dir)
+        result = load_config(complex_config_dir)
 
         assert "areas" in result
         assert "jira" in result["areas"]
         assert "agenda" in result
         assert len(result["areas"]["jira"]["items"]) == 1
 
+    def test_load_config_reuses_parsed_config_while_file_unchanged(self, temp_dir):
+        """load_config returns the cached config when gameplan.yaml has not changed."""
+        (temp_dir / "gameplan.yaml").write_text("areas:\n  jira:\n    items: []\n")
+
+        first = load_config(temp_dir)
+        second = load_config(temp_dir)
+
+        assert second is first
+
+    def test_load_config_shares_parse_with_agenda(self, temp_dir):
+        """sync and agenda memoize gameplan.yaml under the same key."""
+        from cli.agenda import _load_agenda_config
+
+        (temp_dir / "gameplan.yaml").write_text("agenda:\n  sections: []\n")
+
+        assert _load_agenda_config(temp_dir) is load_config(temp_dir)
+
+    def test_load_config_reparses_when_file_changes(self, temp_dir):
+        """load_config reloads gameplan.yaml after it is modified."""
+        config_file = temp_dir / "gameplan.yaml"
+        config_file.write_text("areas:\n  jira:\n    items: []\n")
+        load_config(temp_dir)
+
+        config_file.write_text("areas: {}\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        assert load_config(temp_dir) == {"areas": {}}
+
+    def test_load_config_reads_json_cache_in_new_process(self, temp_dir, monkeypatch):
+        """load_config uses the JSON cache instead of reparsing unchanged YAML."""
+        from cli import cache, sync
+
+        (temp_dir / "gameplan.yaml").write_text("areas:\n  jira:\n    items: []\n")
+        expected = load_config(temp_dir)
+        assert cache.cache_file_for("config", temp_dir / "gameplan.yaml").exists()
+        # Nothing is written into the gameplan repository itself
+        assert [p.name for p in temp_dir.iterdir()] == ["gameplan.yaml"]
+
+        # Simulate a fresh process with YAML parsing unavailable
+        monkeypatch.setattr(cache, "_memo", {})
+        monkeypatch.setattr(sync.yaml, "load", Mock(side_effect=AssertionError("parsed")))
+
+        assert load_config(temp_dir) == expected
+
+    def test_load_config_ignores_stale_json_cache(self, temp_dir):
+        """load_config reparses when the cache was written for other content."""
+        from cli.cache import cache_file_for
+
+        (temp_dir / "gameplan.yaml").write_text("areas:\n  jira:\n    items: []\n")
+        cache_file = cache_file_for("config", temp_dir / "gameplan.yaml")
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text('{"hash": "stale", "config": {"areas": {}}}')
+
+        assert load_config(temp_dir) == {"areas": {"jira": {"items": []}}}
+
 
 class TestSyncJira:
     """Tests for syncing Jira issues."""
 
-    @patch("cli.sync.JiraAdapter")
-    def test_sync_jira_loads_config_and_creates_adapter(self, mock_adapter_class, temp_dir):
-        """sync_jira loads config and creates JiraAdapter."""
-        # Setup config file
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""
-areas:
-  jira:
-    items:
-      - issue: PROJ-123
-        env: prod
-""")
+    @pytest.mark.parametrize(
+        "has_changes, title, expected_output",
+        [
+            (False, "Test Issue", "Status: In Progress | Assignee: testuser"),
+            (True, "Test Issue", "Issue has been updated"),
+            (False, "", "Could not fetch data"),  # Empty title indicates failure
+        ],
+        ids=["unchanged", "changed", "fetch-failed"],
+    )
+    def test_sync_jira_syncs_single_issue(
+        self, mock_adapter_class, temp_dir, capsys, patch_config,
+        has_changes, title, expected_output,
+    ):
+        """sync_jira creates the adapter from config and reports each issue."""
+        patch_config(SINGLE_ITEM_CONFIG)
 
-        # Mock adapter instance
-        mock_adapter = MagicMock()
+        mock_adapter = mock_adapter_class.return_value
         mock_adapter.load_config.return_value = [
             TrackedItem(
                 id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123", "env": "prod"}
             )
         ]
         mock_adapter.fetch_item_data.return_value = ItemData(
-            title="Test Issue",
-            status="In Progress",
+            title=title,
+            status="In Progress" if title else "",
             updates=[],
-            raw_data={"fields": {"assignee": {"displayName": "testuser"}}},
+            raw_data={"fields": {"assignee": {"displayName": "testuser"}}} if title else {},
         )
         mock_adapter.get_storage_path.return_value = temp_dir / "tracking/areas/jira/PROJ-123"
-        mock_adapter.detect_changes.return_value = False
-        mock_adapter_class.return_value = mock_adapter
+        mock_adapter.detect_changes.return_value = has_changes
 
         sync_jira(temp_dir)
 
@@ -101,12 +247,15 @@ areas:
         assert mock_adapter_class.call_args[0][0] == {
             "items": [{"issue": "PROJ-123", "env": "prod"}]
         }
+        captured = capsys.readouterr()
+        assert expected_output in captured.out
+        assert mock_adapter.update_readme.call_count == (1 if title else 0)
 
-    @patch("cli.sync.JiraAdapter")
-    def test_sync_jira_warns_if_no_jira_config(self, mock_adapter_class, temp_dir, capsys):
+    def test_sync_jira_warns_if_no_jira_config(
+        self, mock_adapter_class, temp_dir, capsys, patch_config
+    ):
         """sync_jira warns if no Jira section in config."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("areas: {}\n")
+        patch_config({"areas": {}})
 
         sync_jira(temp_dir)
 
@@ -114,36 +263,25 @@ areas:
         assert "No Jira configuration found" in captured.out
         mock_adapter_class.assert_not_called()
 
-    @patch("cli.sync.JiraAdapter")
-    def test_sync_jira_warns_if_no_tracked_items(self, mock_adapter_class, temp_dir, capsys):
+    def test_sync_jira_warns_if_no_tracked_items(
+        self, mock_adapter_class, temp_dir, capsys, patch_config
+    ):
         """sync_jira warns if no tracked items."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("areas:\n  jira:\n    items: []\n")
-
-        mock_adapter = MagicMock()
-        mock_adapter.load_config.return_value = []
-        mock_adapter_class.return_value = mock_adapter
+        patch_config({"areas": {"jira": {"items": []}}})
 
         sync_jira(temp_dir)
 
         captured = capsys.readouterr()
         assert "No tracked Jira issues found" in captured.out
+        mock_adapter_class.assert_not_called()
 
-    @patch("cli.sync.JiraAdapter")
-    def test_sync_jira_fetches_and_updates_each_item(self, mock_adapter_class, temp_dir):
+    def test_sync_jira_fetches_and_updates_each_item(
+        self, mock_adapter_class, temp_dir, patch_config
+    ):
         """sync_jira fetches data and updates README for each item."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""
-areas:
-  jira:
-    items:
-      - issue: PROJ-123
-        env: prod
-      - issue: PROJ-456
-        env: prod
-""")
+        patch_config(TWO_ITEM_CONFIG)
 
-        mock_adapter = MagicMock()
+        mock_adapter = mock_adapter_class.return_value
         mock_adapter.load_config.return_value = [
             TrackedItem(
                 id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123", "env": "prod"}
@@ -166,102 +304,197 @@ areas:
                 raw_data={"fields": {"assignee": {"displayName": "user2"}}},
             ),
         ]
+        mock_adapter.find_readme_path.return_value = None
         mock_adapter.get_storage_path.side_effect = [
-            temp_dir / "tracking/areas/jira/PROJ-123",
             temp_dir / "tracking/areas/jira/PROJ-123-first-issue",
-            temp_dir / "tracking/areas/jira/PROJ-456",
             temp_dir / "tracking/areas/jira/PROJ-456-second-issue",
         ]
         mock_adapter.detect_changes.return_value = False
-        mock_adapter_class.return_value = mock_adapter
 
         sync_jira(temp_dir)
 
         # Verify fetch_item_data called for each item
         assert mock_adapter.fetch_item_data.call_count == 2
+        # Verify each item's path is worked out once
+        assert mock_adapter.get_storage_path.call_count == 2
         # Verify update_readme called for each item
         assert mock_adapter.update_readme.call_count == 2
         # Verify save_metadata called for each item
         assert mock_adapter.save_metadata.call_count == 2
 
-    @patch("cli.sync.JiraAdapter")
-    def test_sync_jira_detects_changes(self, mock_adapter_class, temp_dir, capsys):
-        """sync_jira prints notification when changes detected."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""
-areas:
-  jira:
-    items:
-      - issue: PROJ-123
-        env: prod
-""")
+    def test_sync_jira_fetches_items_concurrently(self, mock_adapter_class, temp_dir, patch_config):
+        """sync_jira overlaps the per-issue fetches."""
+        patch_config(TWO_ITEM_CONFIG)
+
+        # Both fetches must be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(item, since=None):
+            barrier.wait()
+            return ItemData(title=f"{item.id} title", status="Open", raw_data={})
 
-        mock_adapter = MagicMock()
+        mock_adapter = mock_adapter_class.return_value
         mock_adapter.load_config.return_value = [
-            TrackedItem(
-                id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123", "env": "prod"}
-            )
+            TrackedItem(id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123"}),
+            TrackedItem(id="PROJ-456", adapter="jira", metadata={"issue": "PROJ-456"}),
         ]
-        mock_adapter.fetch_item_data.return_value = ItemData(
-            title="Test Issue",
-            status="In Progress",
-            updates=[],
-            raw_data={"fields": {"assignee": {"displayName": "testuser"}}},
+        mock_adapter.fetch_item_data.side_effect = fetch
+        mock_adapter.find_readme_path.return_value = None
+        mock_adapter.get_storage_path.side_effect = lambda item, title: (
+            temp_dir / "tracking/areas/jira" / item.id / "README.md"
         )
-        mock_adapter.get_storage_path.return_value = temp_dir / "tracking/areas/jira/PROJ-123"
-        mock_adapter.detect_changes.return_value = True  # Changes detected
-        mock_adapter_class.return_value = mock_adapter
+        mock_adapter.detect_changes.return_value = False
 
         sync_jira(temp_dir)
 
-        captured = capsys.readouterr()
-        assert "Issue has been updated" in captured.out
+        # Results are applied in config order
+        updated = [c.args[1].title for c in mock_adapter.update_readme.call_args_list]
+        assert updated == ["PROJ-123 title", "PROJ-456 title"]
 
-    @patch("cli.sync.JiraAdapter")
-    def test_sync_jira_skips_item_if_fetch_fails(self, mock_adapter_class, temp_dir, capsys):
-        """sync_jira skips item if data fetch fails."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""
-areas:
-  jira:
-    items:
-      - issue: PROJ-123
-        env: prod
-""")
+    def test_sync_jira_fetches_bulk_then_falls_back_per_issue(
+        self, mock_adapter_class, temp_dir, patch_config
+    ):
+        """sync_jira uses the bulk search and fetches only the issues it missed."""
+        patch_config(TWO_ITEM_CONFIG)
 
-        mock_adapter = MagicMock()
-        mock_adapter.load_config.return_value = [
-            TrackedItem(
-                id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123", "env": "prod"}
-            )
+        items = [
+            TrackedItem(id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123"}),
+            TrackedItem(id="PROJ-456", adapter="jira", metadata={"issue": "PROJ-456"}),
         ]
+        mock_adapter = mock_adapter_class.return_value
+        mock_adapter.load_config.return_value = items
+        mock_adapter.fetch_items_bulk.return_value = {
+            "PROJ-123": ItemData(title="Bulk", status="Open", raw_data={}),
+        }
         mock_adapter.fetch_item_data.return_value = ItemData(
-            title="",  # Empty title indicates failure
-            status="",
-            updates=[],
-            raw_data={},
+            title="Single", status="Open", raw_data={}
         )
-        mock_adapter.get_storage_path.return_value = temp_dir / "tracking/areas/jira/PROJ-123"
-        mock_adapter_class.return_value = mock_adapter
+        mock_adapter.find_readme_path.return_value = None
+        mock_adapter.get_storage_path.side_effect = lambda item, title: (
+            temp_dir / "tracking/areas/jira" / item.id / "README.md"
+        )
+        mock_adapter.detect_changes.return_value = False
 
         sync_jira(temp_dir)
 
+        mock_adapter.fetch_items_bulk.assert_called_once_with(items, since={})
+        mock_adapter.fetch_item_data.assert_called_once_with(items[1], since=None)
+        updated = [c.args[1].title for c in mock_adapter.update_readme.call_args_list]
+        assert updated == ["Bulk", "Single"]
+
+    @pytest.mark.parametrize("force", [False, True], ids=["polled", "forced"])
+    def test_sync_jira_skips_issues_not_due_unless_forced(
+        self, mock_adapter_class, temp_dir, capsys, patch_config, force
+    ):
+        """sync_jira leaves quiet issues alone until due, unless forced."""
+        patch_config(TWO_ITEM_CONFIG)
+
+        items = [
+            TrackedItem(id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123"}),
+            TrackedItem(id="PROJ-456", adapter="jira", metadata={"issue": "PROJ-456"}),
+        ]
+        mock_adapter = mock_adapter_class.return_value
+        mock_adapter.load_config.return_value = items
+        mock_adapter.find_readme_path.side_effect = lambda item: (
+            temp_dir / "tracking/areas/jira" / f"{item.id}-title" / "README.md"
+        )
+        # Only PROJ-456 is due
+        mock_adapter.is_poll_due.side_effect = lambda path: "PROJ-456" in str(path)
+        mock_adapter.load_metadata.return_value = {"updated": "2025-01-15T10:00:00.000+0000"}
+        mock_adapter.fetch_item_data.return_value = ItemData(
+            title="Title", status="Open", raw_data={}
+        )
+        mock_adapter.get_storage_path.side_effect = lambda item, title: (
+            temp_dir / "tracking/areas/jira" / f"{item.id}-title" / "README.md"
+        )
+        mock_adapter.detect_changes.return_value = False
+
+        sync_jira(temp_dir, force=force)
+
         captured = capsys.readouterr()
-        assert "Could not fetch data" in captured.out
+        if force:
+            mock_adapter.is_poll_due.assert_not_called()
+            mock_adapter.fetch_items_bulk.assert_called_once_with(items, since={})
+            assert mock_adapter.update_readme.call_count == 2
+        else:
+            mock_adapter.fetch_item_data.assert_called_once_with(
+                items[1], since="2025-01-15T10:00:00.000+0000"
+            )
+            assert "Skipping PROJ-123" in captured.out
+            updated = [c.args[0] for c in mock_adapter.update_readme.call_args_list]
+            assert updated == [temp_dir / "tracking/areas/jira/PROJ-456-title/README.md"]
+
+    def test_sync_jira_leaves_readme_alone_when_not_modified(
+        self, mock_adapter_class, temp_dir, patch_config
+    ):
+        """sync_jira keeps metadata current but skips the README for unchanged issues."""
+        patch_config(SINGLE_ITEM_CONFIG)
+
+        item = TrackedItem(id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123"})
+        readme_path = temp_dir / "tracking/areas/jira/PROJ-123-title/README.md"
+        mock_adapter = mock_adapter_class.return_value
+        mock_adapter.load_config.return_value = [item]
+        mock_adapter.find_readme_path.return_value = readme_path
+        mock_adapter.load_metadata.return_value = {"updated": "2025-01-15T10:00:00.000+0000"}
+        mock_adapter.fetch_item_data.return_value = ItemData(
+            title="Title", status="Open", raw_data={}, not_modified=True
+        )
+        mock_adapter.get_storage_path.return_value = readme_path
+        mock_adapter.detect_changes.return_value = False
+
+        sync_jira(temp_dir)
+
+        mock_adapter.fetch_item_data.assert_called_once_with(
+            item, since="2025-01-15T10:00:00.000+0000"
+        )
         mock_adapter.update_readme.assert_not_called()
+        mock_adapter.save_metadata.assert_called_once()
 
+    def test_sync_jira_leaves_readme_alone_when_bulk_not_modified(
+        self, mock_adapter_class, temp_dir, patch_config
+    ):
+        """sync_jira passes stored timestamps to the bulk search and honors its flag."""
+        patch_config(TWO_ITEM_CONFIG)
 
-    @patch("cli.sync.JiraAdapter")
-    def test_sync_jira_renames_directory_on_title_change(self, mock_adapter_class, temp_dir, capsys):
+        items = [
+            TrackedItem(id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123"}),
+            TrackedItem(id="PROJ-456", adapter="jira", metadata={"issue": "PROJ-456"}),
+        ]
+        mock_adapter = mock_adapter_class.return_value
+        mock_adapter.load_config.return_value = items
+        mock_adapter.find_readme_path.side_effect = lambda item: (
+            temp_dir / "tracking/areas/jira" / f"{item.id}-title" / "README.md"
+        )
+        mock_adapter.is_poll_due.return_value = True
+        mock_adapter.load_metadata.return_value = {"updated": "2025-01-15T10:00:00.000+0000"}
+        mock_adapter.fetch_items_bulk.return_value = {
+            "PROJ-123": ItemData(title="Same", status="Open", raw_data={}, not_modified=True),
+            "PROJ-456": ItemData(title="Changed", status="Open", raw_data={}),
+        }
+        mock_adapter.get_storage_path.side_effect = lambda item, title: (
+            temp_dir / "tracking/areas/jira" / f"{item.id}-title" / "README.md"
+        )
+        mock_adapter.detect_changes.return_value = False
+
+        sync_jira(temp_dir)
+
+        mock_adapter.fetch_items_bulk.assert_called_once_with(
+            items,
+            since={
+                "PROJ-123": "2025-01-15T10:00:00.000+0000",
+                "PROJ-456": "2025-01-15T10:00:00.000+0000",
+            },
+        )
+        mock_adapter.fetch_item_data.assert_not_called()
+        updated = [c.args[1].title for c in mock_adapter.update_readme.call_args_list]
+        assert updated == ["Changed"]
+        assert mock_adapter.save_metadata.call_count == 2
+
+    def test_sync_jira_renames_directory_on_title_change(
+        self, mock_adapter_class, temp_dir, capsys, patch_config
+    ):
         """sync_jira renames directory when Jira title changes."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""
-areas:
-  jira:
-    items:
-      - issue: PROJ-123
-        env: prod
-""")
+        patch_config(SINGLE_ITEM_CONFIG)
 
         # Create existing directory with old title
         old_dir = temp_dir / "tracking/areas/jira/PROJ-123-old-title"
@@ -271,7 +504,7 @@ areas:
         old_metadata = old_dir / ".metadata.json"
         old_metadata.write_text('{"last_sync": "2026-01-01"}')
 
-        mock_adapter = MagicMock()
+        mock_adapter = mock_adapter_class.return_value
         mock_adapter.load_config.return_value = [
             TrackedItem(id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123", "env": "prod"})
         ]
@@ -287,7 +520,6 @@ areas:
         new_dir = temp_dir / "tracking/areas/jira/PROJ-123-new-title"
         mock_adapter.get_storage_path.return_value = new_dir / "README.md"
         mock_adapter.detect_changes.return_value = False
-        mock_adapter_class.return_value = mock_adapter
 
         sync_jira(temp_dir)
 
@@ -302,24 +534,18 @@ areas:
         captured = capsys.readouterr()
         assert "Title changed, renaming directory" in captured.out
 
-    @patch("cli.sync.JiraAdapter")
-    def test_sync_jira_no_rename_when_title_unchanged(self, mock_adapter_class, temp_dir, capsys):
+    def test_sync_jira_no_rename_when_title_unchanged(
+        self, mock_adapter_class, temp_dir, capsys, patch_config
+    ):
         """sync_jira does not rename when title hasn't changed."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""
-areas:
-  jira:
-    items:
-      - issue: PROJ-123
-        env: prod
-""")
+        patch_config(SINGLE_ITEM_CONFIG)
 
         existing_dir = temp_dir / "tracking/areas/jira/PROJ-123-same-title"
         existing_dir.mkdir(parents=True)
         existing_readme = existing_dir / "README.md"
         existing_readme.write_text("---\ntitle: Same Title\n---\n")
 
-        mock_adapter = MagicMock()
+        mock_adapter = mock_adapter_class.return_value
         mock_adapter.load_config.return_value = [
             TrackedItem(id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123", "env": "prod"})
         ]
@@ -333,28 +559,21 @@ areas:
         mock_adapter.find_readme_path.return_value = existing_readme
         mock_adapter.get_storage_path.return_value = existing_readme
         mock_adapter.detect_changes.return_value = False
-        mock_adapter_class.return_value = mock_adapter
 
         sync_jira(temp_dir)
 
         captured = capsys.readouterr()
         assert "Title changed" not in captured.out
 
-    @patch("cli.sync.JiraAdapter")
-    def test_sync_jira_uses_existing_path_for_detect_changes(self, mock_adapter_class, temp_dir):
+    def test_sync_jira_uses_existing_path_for_detect_changes(
+        self, mock_adapter_class, temp_dir, patch_config
+    ):
         """sync_jira uses find_readme_path result for detect_changes, not key-only path."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""
-areas:
-  jira:
-    items:
-      - issue: PROJ-123
-        env: prod
-""")
+        patch_config(SINGLE_ITEM_CONFIG)
 
         existing_readme = temp_dir / "tracking/areas/jira/PROJ-123-my-issue/README.md"
 
-        mock_adapter = MagicMock()
+        mock_adapter = mock_adapter_class.return_value
         mock_adapter.load_config.return_value = [
             TrackedItem(id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123", "env": "prod"})
         ]
@@ -367,7 +586,6 @@ areas:
         mock_adapter.find_readme_path.return_value = existing_readme
         mock_adapter.get_storage_path.return_value = existing_readme
         mock_adapter.detect_changes.return_value = False
-        mock_adapter_class.return_value = mock_adapter
 
         sync_jira(temp_dir)
 
@@ -378,16 +596,14 @@ areas:
 class TestSaveConfig:
     """Tests for saving gameplan.yaml configuration."""
 
-    def test_save_config_updates_items(self, temp_dir):
+    def test_save_config_updates_items(self, temp_dir, read_yaml, write_config):
         """save_config writes items to gameplan.yaml."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("areas:\n  jira:\n    items: []\n")
+        config_file = write_config({"areas": {"jira": {"items": []}}})
 
         items = [{"issue": "PROJ-123", "env": "prod"}]
         save_config(temp_dir, items)
 
-        with open(config_file) as f:
-            saved = yaml.safe_load(f)
+        saved = read_yaml(config_file)
         assert saved["areas"]["jira"]["items"] == items
 
     def test_save_config_preserves_comments(self, temp_dir):
@@ -408,7 +624,7 @@ areas:
         assert "# Gameplan Configuration" in content
         assert "# Add Jira issues you're actively working on" in content
 
-    def test_save_config_preserves_emoji(self, temp_dir):
+    def test_save_config_preserves_emoji(self, temp_dir, read_yaml):
         """save_config preserves emoji characters in other sections."""
         config_file = temp_dir / "gameplan.yaml"
         original = """\
@@ -426,14 +642,12 @@ agenda:
 
         save_config(temp_dir, [{"issue": "NEW-1", "env": "prod"}])
 
-        content = config_file.read_text()
-        with open(config_file) as f:
-            saved = yaml.safe_load(f)
+        saved = read_yaml(config_file)
         assert saved["agenda"]["sections"][0]["emoji"] is not None
         assert saved["agenda"]["sections"][1]["emoji"] is not None
         assert saved["areas"]["jira"]["items"][0]["issue"] == "NEW-1"
 
-    def test_save_config_preserves_other_jira_keys(self, temp_dir):
+    def test_save_config_preserves_other_jira_keys(self, temp_dir, read_yaml):
         """save_config preserves env, command, populate under areas.jira."""
         config_file = temp_dir / "gameplan.yaml"
         original = """\
@@ -449,19 +663,18 @@ areas:
 
         save_config(temp_dir, [{"issue": "X-1", "env": "prod"}])
 
-        with open(config_file) as f:
-            saved = yaml.safe_load(f)
+        saved = read_yaml(config_file)
         assert saved["areas"]["jira"]["env"] == "prod"
         assert saved["areas"]["jira"]["command"] == "/usr/local/bin/jirahhh"
         assert saved["areas"]["jira"]["populate"]["search"] == "project = TEST"
 
     def test_save_config_preserves_full_init_template(self, temp_dir):
         """save_config preserves the full init template structure and comments."""
-        from cli.init import _create_gameplan_yaml
+        from cli.init import _GAMEPLAN_YAML_TEMPLATE, _create_gameplan_yaml
 
         config_file = temp_dir / "gameplan.yaml"
         _create_gameplan_yaml(config_file)
-        original_content = config_file.read_text()
+        original_content = _GAMEPLAN_YAML_TEMPLATE
 
         save_config(temp_dir, [{"issue": "PROJ-1", "env": "prod", "source": "populate"}])
 
@@ -471,28 +684,32 @@ areas:
         assert "# Areas: Define what you want to track" in updated_content
         assert "# Agenda: Configure your daily AGENDA.md file" in updated_content
         # Agenda section should be completely untouched
-        for line in original_content.split("\n"):
+        updated_lines = frozenset(updated_content.splitlines())
+        for line in original_content.splitlines():
             if line.startswith("# Agenda") or "agenda:" in line or "sections:" in line:
-                assert line in updated_content
+                assert line in updated_lines
 
 
 class TestPopulateJiraItems:
     """Tests for populating Jira items from search."""
 
-    @patch("cli.sync.JiraAdapter")
-    def test_populate_searches_and_updates_config(self, mock_adapter_class, temp_dir):
+    def test_populate_searches_and_updates_config(
+        self, mock_adapter_class, temp_dir, read_yaml, write_config
+    ):
         """populate_jira_items runs search and saves results to config."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""\
-areas:
-  jira:
-    populate:
-      search: "assignee = currentUser() AND statusCategory != Done"
-    env: prod
-    items: []
-""")
-
-        mock_adapter = MagicMock()
+        config_file = write_config({
+            "areas": {
+                "jira": {
+                    "populate": {
+                        "search": "assignee = currentUser() AND statusCategory != Done",
+                    },
+                    "env": "prod",
+                    "items": [],
+                },
+            },
+        })
+
+        mock_adapter = mock_adapter_class.return_value
         mock_adapter.search_issues.return_value = [
             TrackedItem(
                 id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123", "env": "prod"}
@@ -501,7 +718,6 @@ areas:
                 id="PROJ-456", adapter="jira", metadata={"issue": "PROJ-456", "env": "prod"}
             ),
         ]
-        mock_adapter_class.return_value = mock_adapter
 
         populate_jira_items(temp_dir)
 
@@ -512,33 +728,30 @@ areas:
         )
 
         # Verify config was updated with source: populate tag
-        with open(config_file) as f:
-            saved = yaml.safe_load(f)
+        saved = read_yaml(config_file)
         items = saved["areas"]["jira"]["items"]
         assert len(items) == 2
         assert items[0] == {"issue": "PROJ-123", "env": "prod", "source": "populate"}
         assert items[1] == {"issue": "PROJ-456", "env": "prod", "source": "populate"}
 
-    @patch("cli.sync.JiraAdapter")
-    def test_populate_with_cli_overrides(self, mock_adapter_class, temp_dir):
+    def test_populate_with_cli_overrides(self, mock_adapter_class, temp_dir, write_config):
         """populate_jira_items accepts JQL and env overrides."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""\
-areas:
-  jira:
-    populate:
-      search: "assignee = currentUser()"
-    env: prod
-    items: []
-""")
-
-        mock_adapter = MagicMock()
+        write_config({
+            "areas": {
+                "jira": {
+                    "populate": {"search": "assignee = currentUser()"},
+                    "env": "prod",
+                    "items": [],
+                },
+            },
+        })
+
+        mock_adapter = mock_adapter_class.return_value
         mock_adapter.search_issues.return_value = [
             TrackedItem(
                 id="TEST-1", adapter="jira", metadata={"issue": "TEST-1", "env": "staging"}
             ),
         ]
-        mock_adapter_class.return_value = mock_adapter
 
         populate_jira_items(temp_dir, jql="project = TEST", env="staging")
 
@@ -548,197 +761,76 @@ areas:
             env="staging",
         )
 
-    @patch("cli.sync.JiraAdapter")
-    def test_populate_removes_stale_populate_items(self, mock_adapter_class, temp_dir):
-        """populate_jira_items removes old source: populate items not in search results."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""\
-areas:
-  jira:
-    env: prod
-    items:
-      - issue: OLD-1
-        env: prod
-        source: populate
-      - issue: OLD-2
-        env: prod
-        source: populate
-""")
-
-        mock_adapter = MagicMock()
-        mock_adapter.search_issues.return_value = [
-            TrackedItem(id="NEW-1", adapter="jira", metadata={"issue": "NEW-1", "env": "prod"}),
-        ]
-        mock_adapter_class.return_value = mock_adapter
-
-        populate_jira_items(temp_dir)
-
-        with open(config_file) as f:
-            saved = yaml.safe_load(f)
-        items = saved["areas"]["jira"]["items"]
-        assert len(items) == 1
-        assert items[0]["issue"] == "NEW-1"
-        assert items[0]["source"] == "populate"
-
-    @patch("cli.sync.JiraAdapter")
-    def test_populate_preserves_manual_items(self, mock_adapter_class, temp_dir):
-        """populate_jira_items preserves items without source: populate."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""\
-areas:
-  jira:
-    env: prod
-    items:
-      - issue: MANUAL-1
-        env: prod
-      - issue: STALE-POPULATE
-        env: prod
-        source: populate
-""")
-
-        mock_adapter = MagicMock()
-        mock_adapter.search_issues.return_value = [
-            TrackedItem(id="NEW-1", adapter="jira", metadata={"issue": "NEW-1", "env": "prod"}),
-        ]
-        mock_adapter_class.return_value = mock_adapter
-
-        populate_jira_items(temp_dir)
-
-        with open(config_file) as f:
-            saved = yaml.safe_load(f)
-        items = saved["areas"]["jira"]["items"]
-        # MANUAL-1 should be kept, STALE-POPULATE removed, NEW-1 added
-        issues = [i["issue"] for i in items]
-        assert "MANUAL-1" in issues
-        assert "NEW-1" in issues
-        assert "STALE-POPULATE" not in issues
-
-    @patch("cli.sync.JiraAdapter")
-    def test_populate_does_not_duplicate_existing_populate_items(
-        self, mock_adapter_class, temp_dir
+    @pytest.mark.parametrize("initial_items, search_keys, expected_items", POPULATE_CASES)
+    def test_populate_merges_search_results(
+        self,
+        mock_adapter_class,
+        temp_dir,
+        read_yaml,
+        write_config,
+        initial_items,
+        search_keys,
+        expected_items,
     ):
-        """populate_jira_items does not duplicate items already present from previous populate."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""\
-areas:
-  jira:
-    env: prod
-    items:
-      - issue: PROJ-123
-        env: prod
-        source: populate
-""")
+        """populate_jira_items merges search results with existing items."""
+        config_file = write_config({"areas": {"jira": {"env": "prod", "items": initial_items}}})
 
-        mock_adapter = MagicMock()
-        mock_adapter.search_issues.return_value = [
-            TrackedItem(
-                id="PROJ-123", adapter="jira", metadata={"issue": "PROJ-123", "env": "prod"}
-            ),
-            TrackedItem(
-                id="PROJ-456", adapter="jira", metadata={"issue": "PROJ-456", "env": "prod"}
-            ),
+        mock_adapter_class.return_value.search_issues.return_value = [
+            TrackedItem(id=key, adapter="jira", metadata={"issue": key, "env": "prod"})
+            for key in search_keys
         ]
-        mock_adapter_class.return_value = mock_adapter
 
         populate_jira_items(temp_dir)
 
-        with open(config_file) as f:
-            saved = yaml.safe_load(f)
-        items = saved["areas"]["jira"]["items"]
-        issue_keys = [i["issue"] for i in items]
-        assert issue_keys.count("PROJ-123") == 1
-        assert "PROJ-456" in issue_keys
-
-    @patch("cli.sync.JiraAdapter")
-    def test_populate_does_not_tag_manual_item_matching_search(self, mock_adapter_class, temp_dir):
-        """If a manual item matches a search result, it stays manual."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""\
-areas:
-  jira:
-    env: prod
-    items:
-      - issue: MANUAL-1
-        env: prod
-""")
+        saved = read_yaml(config_file)
+        assert saved["areas"]["jira"]["items"] == expected_items
 
-        mock_adapter = MagicMock()
-        mock_adapter.search_issues.return_value = [
-            TrackedItem(
-                id="MANUAL-1", adapter="jira", metadata={"issue": "MANUAL-1", "env": "prod"}
-            ),
-            TrackedItem(id="NEW-1", adapter="jira", metadata={"issue": "NEW-1", "env": "prod"}),
-        ]
-        mock_adapter_class.return_value = mock_adapter
-
-        populate_jira_items(temp_dir)
-
-        with open(config_file) as f:
-            saved = yaml.safe_load(f)
-        items = saved["areas"]["jira"]["items"]
-        manual_item = next(i for i in items if i["issue"] == "MANUAL-1")
-        new_item = next(i for i in items if i["issue"] == "NEW-1")
-        # Manual item should NOT get source: populate
-        assert "source" not in manual_item
-        # New item should be tagged
-        assert new_item["source"] == "populate"
-
-    @patch("cli.sync.JiraAdapter")
-    def test_populate_preserves_other_config_keys(self, mock_adapter_class, temp_dir):
+    def test_populate_preserves_other_config_keys(
+        self, mock_adapter_class, temp_dir, read_yaml, write_config
+    ):
         """populate_jira_items preserves populate.search, env, command, and agenda config."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""\
-areas:
-  jira:
-    populate:
-      search: "assignee = currentUser()"
-    env: prod
-    command: /usr/local/bin/jirahhh
-    items: []
-agenda:
-  sections:
-    - name: Focus
-""")
-
-        mock_adapter = MagicMock()
+        config_file = write_config({
+            "areas": {
+                "jira": {
+                    "populate": {"search": "assignee = currentUser()"},
+                    "env": "prod",
+                    "command": "/usr/local/bin/jirahhh",
+                    "items": [],
+                },
+            },
+            "agenda": {"sections": [{"name": "Focus"}]},
+        })
+
+        mock_adapter = mock_adapter_class.return_value
         mock_adapter.search_issues.return_value = [
             TrackedItem(id="PROJ-1", adapter="jira", metadata={"issue": "PROJ-1", "env": "prod"}),
         ]
-        mock_adapter_class.return_value = mock_adapter
 
         populate_jira_items(temp_dir)
 
-        with open(config_file) as f:
-            saved = yaml.safe_load(f)
+        saved = read_yaml(config_file)
         assert saved["areas"]["jira"]["populate"]["search"] == "assignee = currentUser()"
         assert saved["areas"]["jira"]["env"] == "prod"
         assert saved["areas"]["jira"]["command"] == "/usr/local/bin/jirahhh"
         assert saved["agenda"]["sections"][0]["name"] == "Focus"
 
-    def test_populate_warns_if_no_jira_config(self, temp_dir, capsys):
+    def test_populate_warns_if_no_jira_config(self, temp_dir, capsys, write_config):
         """populate_jira_items warns if no Jira config exists."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("areas: {}\n")
+        write_config({"areas": {}})
 
         populate_jira_items(temp_dir)
 
         captured = capsys.readouterr()
         assert "No Jira configuration found" in captured.out
 
-    @patch("cli.sync.JiraAdapter")
-    def test_populate_uses_default_jql_when_not_configured(self, mock_adapter_class, temp_dir):
+    def test_populate_uses_default_jql_when_not_configured(
+        self, mock_adapter_class, temp_dir, write_config
+    ):
         """populate_jira_items uses default JQL when no search in config or args."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""\
-areas:
-  jira:
-    env: prod
-    items: []
-""")
+        write_config({"areas": {"jira": {"env": "prod", "items": []}}})
 
-        mock_adapter = MagicMock()
+        mock_adapter = mock_adapter_class.return_value
         mock_adapter.search_issues.return_value = []
-        mock_adapter_class.return_value = mock_adapter
 
         populate_jira_items(temp_dir)
 
@@ -748,35 +840,6 @@ areas:
             env="prod",
         )
 
-    @patch("cli.sync.JiraAdapter")
-    def test_populate_empty_results_removes_only_populate_items(self, mock_adapter_class, temp_dir):
-        """Empty search results removes populate items but keeps manual ones."""
-        config_file = temp_dir / "gameplan.yaml"
-        config_file.write_text("""\
-areas:
-  jira:
-    env: prod
-    items:
-      - issue: MANUAL-1
-        env: prod
-      - issue: POP-1
-        env: prod
-        source: populate
-""")
-
-        mock_adapter = MagicMock()
-        mock_adapter.search_issues.return_value = []
-        mock_adapter_class.return_value = mock_adapter
-
-        populate_jira_items(temp_dir)
-
-        with open(config_file) as f:
-            saved = yaml.safe_load(f)
-        items = saved["areas"]["jira"]["items"]
-        assert len(items) == 1
-        assert items[0]["issue"] == "MANUAL-1"
-
-    @patch("cli.sync.JiraAdapter")
     def test_populate_preserves_yaml_comments(self, mock_adapter_class, temp_dir):
         """populate_jira_items preserves YAML comments in the file."""
         config_file = temp_dir / "gameplan.yaml"
@@ -793,11 +856,10 @@ agenda:
     - name: Focus
 """)
 
-        mock_adapter = MagicMock()
+        mock_adapter = mock_adapter_class.return_value
         mock_adapter.search_issues.return_value = [
             TrackedItem(id="PROJ-1", adapter="jira", metadata={"issue": "PROJ-1", "env": "prod"}),
         ]
-        mock_adapter_class.return_value = mock_adapter
 
         populate_jira_items(temp_dir)
 
@@ -815,4 +877,4 @@ class TestSyncAll:
         """sync_all calls sync_jira."""
         sync_all(temp_dir)
 
-        mock_sync_jira.assert_called_once_with(temp_dir)
+        mock_sync_jira.assert_called_once_with(temp_dir, force=False)